@@ -3,70 +3,134 @@
 import os
 import sys
 import json
-import requests
 import base64
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import re
 
+from export_cursor import ExportCursor
+from kibana_client import KibanaClient
+from monitor_files import MonitorSerializer, read_monitor_config, write_if_changed
+from monitor_manifest import MonitorManifest
+from parallel import bind_output, run_grouped
+from sharding import Shard, write_summary
+
 class SyntheticsExporter:
-    def __init__(self, kibana_url, api_key, spaces=None):
+    def __init__(self, kibana_url, api_key, spaces=None, max_workers=8, page_size=50, parallel_pages=True,
+                 incremental=True, prune_deleted=False, state_dir='.synthetics-state', serializer=None,
+                 max_concurrency=16, parallel_spaces=4, client=None, shard=None):
         self.kibana_url = kibana_url.rstrip('/')  # Remove trailing slash
         self.output_dir = Path('monitors')
+        self.state_dir = Path(state_dir)  # Per-space last-seen revisions for incremental export
+        self.incremental = incremental  # Only fetch monitors whose revision/updated_at moved
+        self.prune_deleted = prune_deleted  # Remove files of deleted monitors and stale location copies
+        self.serializer = serializer or MonitorSerializer()  # Canonical key order, volatile fields dropped
         self.spaces = spaces or ['default']  # Default to 'default' space if none provided
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'ApiKey {api_key}',
-            'Content-Type': 'application/json',
-            'kbn-xsrf': 'true'
-        })
+        self.parallel_spaces = max(1, int(parallel_spaces))  # Spaces exported concurrently
+        self.max_workers = max(1, int(max_workers))  # Concurrent detail-config and page fetches
+        self.page_size = max(1, int(page_size))  # perPage for the monitor list endpoint
+        self.parallel_pages = parallel_pages  # Prefetch pages 2..N concurrently once the total is known
+        self.shard = shard  # Only export monitors this shard owns (see sharding.Shard)
+        self.manifest = None  # monitors/index.json, loaded by export_monitors
+        # Shared client: pooled connections, global in-flight cap, timeouts and retries
+        self.client = client or KibanaClient(kibana_url, api_key, max_concurrency=max_concurrency)
 
     def make_request(self, endpoint):
         """Make HTTP request to Kibana API"""
-        url = f"{self.kibana_url}{endpoint}"
-        
-        try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Request failed: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse JSON response: {str(e)}")
+        return self.client.request_json('GET', endpoint)
 
-    def get_all_monitors(self, space_id='default'):
-        """Fetch all synthetic monitors with pagination for a specific space"""
+    def _ordered_map(self, func, items):
+        """Apply func to items on a bounded worker pool, yielding results in input order
+
+        At most max_workers * 2 calls are queued ahead of the consumer, so the
+        pool never holds more than a small window of results in memory.
+        """
+        func = bind_output(func)  # Keep worker output in the calling space's block
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= self.max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def get_monitors_page(self, page, space_id='default'):
+        """Fetch a single page of monitor summaries for a specific space"""
+        endpoint = f"/s/{space_id}/api/synthetics/monitors?page={page}&perPage={self.page_size}"
+        return self.make_request(endpoint)
+
+    def iter_monitors(self, space_id='default'):
+        """Stream monitor summaries for a specific space, page by page
+
+        Page 1 reports the total; with parallel_pages enabled the remaining
+        pages are prefetched through the worker pool and yielded in page order.
+        """
         print(f"Fetching all synthetic monitors from space: {space_id}")
         
-        all_monitors = []
+        response = self.get_monitors_page(1, space_id)
+        total_monitors = response.get('total', 0)
+        print(f"Found {total_monitors} total monitors in space '{space_id}'")
+        
+        monitors = response.get('monitors', [])
+        print(f"Fetched page 1, got {len(monitors)} monitors from space '{space_id}'")
+        yield from monitors
+        
         page = 1
-        total_monitors = 0
+        fetched = len(monitors)
+        # Kibana may cap perPage below the requested size; page 1 shows the size actually served
+        per_page = len(monitors) if 0 < len(monitors) < min(self.page_size, total_monitors) else self.page_size
+        total_pages = -(-total_monitors // per_page)  # Ceiling division
         
-        while True:
-            # Use space-specific endpoint
-            endpoint = f"/s/{space_id}/api/synthetics/monitors?page={page}&perPage=50"
-            response = self.make_request(endpoint)
-            
-            if page == 1:
-                total_monitors = response.get('total', 0)
-                print(f"Found {total_monitors} total monitors in space '{space_id}'")
-            
+        if self.parallel_pages and total_pages > 1:
+            if per_page != self.page_size:
+                print(f"Kibana returned {per_page} monitors per page instead of {self.page_size}")
+            print(f"Prefetching pages 2-{total_pages} with {self.max_workers} concurrent workers")
+            remaining_pages = range(2, total_pages + 1)
+            responses = self._ordered_map(lambda page: self.get_monitors_page(page, space_id), remaining_pages)
+            for page, response in zip(remaining_pages, responses):
+                monitors = response.get('monitors', [])
+                fetched += len(monitors)
+                print(f"Fetched page {page}, got {len(monitors)} monitors from space '{space_id}'")
+                yield from monitors
+        
+        # Serial walk, or the rest of a prefetch that came up short
+        while monitors and fetched < total_monitors:
+            page += 1
+            response = self.get_monitors_page(page, space_id)
             monitors = response.get('monitors', [])
-            all_monitors.extend(monitors)
+            fetched += len(monitors)
             print(f"Fetched page {page}, got {len(monitors)} monitors from space '{space_id}'")
-            
-            if len(all_monitors) >= total_monitors:
-                break
-                
-            page += 1
+            yield from monitors
         
-        return all_monitors
+        # Unlisted monitors would look deleted (and have their files pruned), so fail the space instead
+        if fetched < total_monitors:
+            raise Exception(f"listing of space '{space_id}' returned {fetched} of {total_monitors} monitors")
+
+    def get_all_monitors(self, space_id='default'):
+        """Fetch all synthetic monitors with pagination for a specific space"""
+        return list(self.iter_monitors(space_id))
 
     def get_monitor_config(self, config_id, space_id='default'):
         """Fetch detailed configuration for a specific monitor in a specific space"""
         print(f"Fetching detailed config for monitor: {config_id} in space: {space_id}")
         return self.make_request(f"/s/{space_id}/api/synthetics/monitors/{config_id}")
 
+    def fetch_monitor_configs(self, monitors, space_id='default'):
+        """Fetch detailed configs concurrently, yielding results in input order
+
+        Yields (monitor, detailed_config, error) tuples; error is None on success.
+        """
+        def fetch(monitor):
+            try:
+                return monitor, self.get_monitor_config(monitor.get('config_id'), space_id), None
+            except Exception as e:
+                return monitor, None, e
+
+        return self._ordered_map(fetch, monitors)
+
     def ensure_output_directory(self):
         """Create output directory if it doesn't exist"""
         if not self.output_dir.exists():
@@ -77,118 +141,317 @@ class SyntheticsExporter:
         """Sanitize filename by replacing invalid characters"""
         return re.sub(r'[^a-zA-Z0-9.-]', '_', name)
 
-    def export_monitors(self):
-        """Main export function"""
+    def state_file_path(self, space_id):
+        """Path of the incremental export state file for a space"""
+        return self.state_dir / f"export-{space_id}{self.shard.suffix if self.shard else ''}.json"
+
+    def cursor_file_path(self, space_id):
+        """Path of the progress cursor an interrupted export of a space leaves behind"""
+        return self.state_dir / f"export-{space_id}{self.shard.suffix if self.shard else ''}.cursor.jsonl"
+
+    def load_export_state(self, space_id):
+        """Load last-seen monitor revisions for a space, or an empty state if none was saved"""
+        state_path = self.state_file_path(space_id)
+        if not state_path.exists():
+            return {}
+        
         try:
-            self.ensure_output_directory()
+            with open(state_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('monitors', {})
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"⚠️  Ignoring unreadable export state {state_path}: {str(e)}")
+            return {}
+
+    def save_export_state(self, space_id, monitors_state):
+        """Persist last-seen monitor revisions for a space (untouched if nothing moved)"""
+        state_path = self.state_file_path(space_id)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        content = json.dumps({'space_id': space_id, 'monitors': monitors_state},
+                             indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        write_if_changed(state_path, content)
+
+    def is_unchanged(self, monitor, previous):
+        """Check whether a list-level monitor summary matches its last exported watermark"""
+        if not previous or 'files' not in previous:
+            return False
+        if previous.get('revision') != monitor.get('revision'):
+            return False
+        if previous.get('updated_at') != monitor.get('updated_at'):
+            return False
+        # A file removed from the tree must be re-exported even if Kibana did not change
+        return all(Path(file_path).exists() for file_path in previous['files'])
+
+    def select_changed_monitors(self, monitors, previous_state, current_state, seen_ids, monitor_counts,
+                                resumed_state=None):
+        """Filter a monitor summary stream down to new or changed monitors
+
+        Unchanged monitors carry their previous state entry forward without a
+        detail fetch; every listed config_id is recorded in seen_ids so
+        deletions can be detected once the listing completes. Monitors an
+        interrupted run already exported (resumed_state) are skipped the same
+        way, even in a full export. With a shard, monitors owned by other
+        shards are listed but never fetched or recorded.
+        """
+        resumed_state = resumed_state or {}
+        for monitor in monitors:
+            config_id = monitor.get('config_id')
+            seen_ids.add(config_id)
             
-            all_exported_monitors = []
-            all_location_summary = {}
+            if self.shard and not self.shard.owns(config_id):
+                monitor_counts['other_shard'] += 1
+                continue
             
-            # Process each space
-            for space_id in self.spaces:
-                print(f"\n=== Processing space: {space_id} ===")
-                
-                # Get all monitors for this space
-                monitors = self.get_all_monitors(space_id)
+            if self.is_unchanged(monitor, resumed_state.get(config_id)):
+                current_state[config_id] = resumed_state[config_id]
+                self.carry_forward_files(resumed_state[config_id], written_by_run=True)
+                monitor_counts['resumed'] += 1
+                continue
+            
+            if self.incremental and self.is_unchanged(monitor, previous_state.get(config_id)):
+                current_state[config_id] = previous_state[config_id]
+                self.carry_forward_files(previous_state[config_id])
+                monitor_counts['unchanged'] += 1
+                continue
+            
+            yield monitor
+
+    def carry_forward_files(self, state, written_by_run=False):
+        """Keep manifest entries for the files of a monitor that is not fetched again
+
+        Files the interrupted run wrote were never saved to the manifest, so
+        they are recorded at the state's revision. Other carried-forward files
+        are refreshed by hash; an edited file loses its synced revision.
+        """
+        if self.manifest is None:
+            return
+        if not written_by_run:
+            self.manifest.refresh(state['files'])
+            return
+        for file_path in state['files']:
+            if self.manifest.is_current(file_path):
+                continue
+            try:
+                self.manifest.record(file_path, read_monitor_config(file_path), state.get('revision'))
+            except Exception:
+                self.manifest.refresh([file_path])  # Unreadable now; refresh drops or re-parses it
+
+    def remove_stale_files(self, file_paths, reason):
+        """Report (and with prune_deleted, remove) exported files that no longer match Kibana"""
+        removed = 0
+        for file_path in sorted(file_paths):
+            if not Path(file_path).exists():
+                continue
+            if self.prune_deleted:
+                Path(file_path).unlink()
+                if self.manifest is not None:
+                    self.manifest.remove(file_path)
+                removed += 1
+                print(f"🗑️  Removed {file_path} ({reason})")
+            else:
+                print(f"⚠️  Stale file {file_path} ({reason}); set EXPORT_PRUNE_DELETED=true to remove")
+        return removed
+
+    def write_monitor_locations(self, space_id, monitor_name, detailed_config):
+        """Write one file per location for a monitor, skipping files whose content is unchanged
+
+        Returns a list of (location_folder, file_path, written) tuples, one per location.
+        """
+        base_filename = f"{self.sanitize_filename(monitor_name)}.json"
+        written = []
+        
+        for location in detailed_config.get('locations', []):
+            location_label = location.get('label', 'unknown-location')
+            
+            # Sanitize location label for folder name
+            location_folder = self.sanitize_filename(location_label.replace('/', '_').replace(' - ', '_'))
+            
+            # Create space and location directory structure: monitors/{space_id}/{location}/
+            location_dir = self.output_dir / space_id / location_folder
+            location_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Create monitor config specific to this location
+            location_specific_config = detailed_config.copy()
+            location_specific_config['locations'] = [location]  # Only this location
+            
+            # Write monitor configuration to location folder (only if the bytes differ)
+            location_file_path = location_dir / base_filename
+            content = self.serializer.serialize(location_specific_config)
+            file_written = write_if_changed(location_file_path, content)
+            if self.manifest is not None:
+                self.manifest.record(location_file_path, location_specific_config,
+                                     detailed_config.get('revision'), content)
+            
+            written.append((location_folder, location_file_path.as_posix(), file_written))
+            if file_written:
+                print(f"Exported: {monitor_name} -> {space_id}/{location_folder}/{base_filename}")
+            else:
+                print(f"Unchanged: {monitor_name} -> {space_id}/{location_folder}/{base_filename}")
+        
+        return written
+
+    def export_space(self, space_id):
+        """Stream one space through page fetch -> change filter -> detail fetch -> per-location writer
+
+        Only counters and the small per-monitor watermark state are kept, so
+        memory does not grow with exported config size. Returns
+        (monitor_counts, location_counts) Counters.
+        """
+        monitor_counts = Counter()
+        location_counts = Counter()  # location_folder -> monitors written there
+        
+        previous_state = self.load_export_state(space_id)
+        current_state = {}
+        seen_ids = set()
+        if self.incremental and previous_state:
+            print(f"Incremental export: {len(previous_state)} monitors recorded in {self.state_file_path(space_id)}")
+        
+        # Progress of an interrupted run; the listing is repeated (it is cheap and keeps deletion
+        # detection complete) but monitors it already exported are not fetched again
+        cursor = ExportCursor(self.cursor_file_path(space_id))
+        if cursor.load():
+            print(f"Resuming interrupted export of '{space_id}': {len(cursor.monitors)} monitors already exported")
+        cursor.open()
+        try:
+            self._export_space_monitors(space_id, previous_state, current_state, seen_ids, cursor,
+                                        monitor_counts, location_counts)
+        except BaseException:
+            cursor.close()  # Keep the cursor so the next run continues from here
+            raise
+        
+        if not seen_ids:
+            print(f"No monitors found in space '{space_id}'")
+        
+        # Monitors recorded last time but absent from a complete listing were deleted in Kibana
+        deleted_ids = sorted(config_id for config_id in previous_state if config_id not in seen_ids)
+        for config_id in deleted_ids:
+            deleted = previous_state[config_id]
+            print(f"🗑️  Monitor '{deleted.get('name', config_id)}' ({config_id}) was deleted in Kibana")
+            monitor_counts['pruned_files'] += self.remove_stale_files(
+                deleted.get('files', []), f"monitor {config_id} deleted in Kibana")
+        monitor_counts['deleted'] = len(deleted_ids)
+        monitor_counts['listed'] = len(seen_ids) - monitor_counts['other_shard']
+        
+        self.save_export_state(space_id, current_state)
+        cursor.complete()
+        
+        return monitor_counts, location_counts
+
+    def _export_space_monitors(self, space_id, previous_state, current_state, seen_ids, cursor,
+                               monitor_counts, location_counts):
+        """Export the changed monitors of a space, recording progress in cursor"""
+        monitors = self.select_changed_monitors(self.iter_monitors(space_id), previous_state,
+                                                current_state, seen_ids, monitor_counts,
+                                                resumed_state=cursor.monitors)
+        print(f"Fetching detailed configs with {self.max_workers} concurrent workers")
+        
+        for monitor, detailed_config, fetch_error in self.fetch_monitor_configs(monitors, space_id):
+            monitor_counts['fetched'] += 1
+            try:
+                if fetch_error is not None:
+                    raise fetch_error
                 
-                if not monitors:
-                    print(f"No monitors found in space '{space_id}'")
-                    continue
+                config_id = monitor.get('config_id')
+                monitor_name = monitor.get('name', config_id)
                 
-                # Export each monitor's detailed configuration
-                exported_monitors = []
-                location_summary = {}
+                if not detailed_config.get('locations'):
+                    print(f"⚠️  Monitor '{monitor_name}' has no locations, skipping location-based export")
+                    monitor_counts['no_locations'] += 1
+                    written = []
+                else:
+                    written = self.write_monitor_locations(space_id, monitor_name, detailed_config)
+                    location_counts.update(location_folder for location_folder, _, _ in written)
+                    monitor_counts['exported'] += 1
+                    monitor_counts['files_written'] += sum(1 for _, _, file_written in written if file_written)
+                    monitor_counts['files_unchanged'] += sum(1 for _, _, file_written in written if not file_written)
                 
-                for monitor in monitors:
-                    try:
-                        config_id = monitor.get('config_id')
-                        monitor_name = monitor.get('name', config_id)
-                        
-                        detailed_config = self.get_monitor_config(config_id, space_id)
-                        
-                        # Get locations from the detailed config
-                        locations = detailed_config.get('locations', [])
-                        
-                        if not locations:
-                            print(f"⚠️  Monitor '{monitor_name}' has no locations, skipping location-based export")
-                            continue
-                        
-                        # Create filename from monitor name or config_id
-                        base_filename = f"{self.sanitize_filename(monitor_name)}.json"
-                        
-                        monitor_locations = []
-                    
-                        # Export monitor to each location folder
-                        for location in locations:
-                            location_label = location.get('label', 'unknown-location')
-                            location_id = location.get('id', 'unknown-id')
-                            
-                            # Sanitize location label for folder name
-                            location_folder = self.sanitize_filename(location_label.replace('/', '_').replace(' - ', '_'))
-                            
-                            # Create space and location directory structure: monitors/{space_id}/{location}/
-                            space_dir = self.output_dir / space_id
-                            location_dir = space_dir / location_folder
-                            location_dir.mkdir(parents=True, exist_ok=True)
-                            
-                            # Create monitor config specific to this location
-                            location_specific_config = detailed_config.copy()
-                            location_specific_config['locations'] = [location]  # Only this location
-                            
-                            # Write monitor configuration to location folder
-                            location_file_path = location_dir / base_filename
-                            with open(location_file_path, 'w', encoding='utf-8') as f:
-                                json.dump(location_specific_config, f, indent=2, ensure_ascii=False)
-                            
-                            monitor_locations.append({
-                                'location_id': location_id,
-                                'location_label': location_label,
-                                'location_folder': location_folder,
-                                'filename': base_filename,
-                                'file_path': f"{space_id}/{location_folder}/{base_filename}"
-                            })
-                            
-                            # Track location summary
-                            if location_folder not in location_summary:
-                                location_summary[location_folder] = {
-                                    'location_label': location_label,
-                                    'location_id': location_id,
-                                    'monitors': []
-                                }
-                            location_summary[location_folder]['monitors'].append({
-                                'name': monitor_name,
-                                'config_id': config_id,
-                                'filename': base_filename
-                            })
-                            
-                            print(f"Exported: {monitor_name} -> {space_id}/{location_folder}/{base_filename}")
-                        
-                        exported_monitors.append({
-                            'config_id': config_id,
-                            'name': monitor_name,
-                            'filename': base_filename,
-                            'total_locations': len(locations),
-                            'locations': monitor_locations
-                        })
-                    except Exception as e:
-                        print(f"Failed to export monitor {monitor.get('config_id', 'unknown')}: {str(e)}")
+                written_files = [file_path for _, file_path, _ in written]
+                current_state[config_id] = {
+                    'name': monitor_name,
+                    'revision': monitor.get('revision'),
+                    'updated_at': monitor.get('updated_at'),
+                    'files': written_files
+                }
+                cursor.record_monitor(config_id, current_state[config_id])
                 
-                # Add this space's results to the overall summary
-                all_exported_monitors.extend(exported_monitors)
-                all_location_summary.update(location_summary)
+                # Renamed monitors and removed locations leave old copies behind
+                previous_files = set(previous_state.get(config_id, {}).get('files', []))
+                monitor_counts['pruned_files'] += self.remove_stale_files(
+                    previous_files - set(written_files), f"stale copy of '{monitor_name}'")
+            except Exception as e:
+                print(f"Failed to export monitor {monitor.get('config_id', 'unknown')}: {str(e)}")
+                monitor_counts['failed'] += 1
+
+    def export_monitors(self, summary_path=None):
+        """Main export function (with summary_path, also writes the run counts as JSON)"""
+        try:
+            self.ensure_output_directory()
+            
+            # Shards would overwrite each other's manifest; a sharded export leaves it to
+            # monitor_manifest.py, which picks up the changed files by hash
+            if not self.shard:
+                self.manifest = MonitorManifest.load(self.output_dir / 'index.json')
+            
+            total_counts = Counter()
+            space_counts = {}
+            space_locations = {}
+            failed_spaces = []
+            
+            def export_one(space_id):
+                print(f"\n=== Processing space: {space_id} ===")
+                return self.export_space(space_id)
+            
+            # Process spaces concurrently; each space's output is printed as one block
+            if len(self.spaces) > 1:
+                print(f"Exporting {len(self.spaces)} spaces, {self.parallel_spaces} at a time")
+            for space_id, result, error in run_grouped(export_one, self.spaces, self.parallel_spaces):
+                if error is not None:
+                    print(f"❌ Export failed for space '{space_id}': {str(error)}")
+                    failed_spaces.append(space_id)
+                    continue
+                monitor_counts, location_counts = result
+                total_counts.update(monitor_counts)
+                space_counts[space_id] = monitor_counts
+                space_locations[space_id] = location_counts
             
             print(f"\n=== Export Summary ===")
             print(f"Processed spaces: {', '.join(self.spaces)}")
-            print(f"Total monitors exported: {len(all_exported_monitors)}")
-            print(f"Total locations: {len(all_location_summary)}")
+            if self.shard:
+                print(f"Shard: {self.shard} ({total_counts['other_shard']} monitors left to other shards)")
+            print(f"Total monitors listed: {total_counts['listed']}")
+            print(f"Total monitors exported: {total_counts['exported']}")
+            print(f"Files written: {total_counts['files_written']}")
+            print(f"Files unchanged (not rewritten): {total_counts['files_unchanged']}")
+            if self.incremental:
+                print(f"Unchanged since last export (skipped): {total_counts['unchanged']}")
+            if total_counts['resumed']:
+                print(f"Already exported by the interrupted run (skipped): {total_counts['resumed']}")
+            if total_counts['deleted']:
+                print(f"Deleted in Kibana: {total_counts['deleted']}")
+            if total_counts['pruned_files']:
+                print(f"Stale files removed: {total_counts['pruned_files']}")
+            print(f"Total locations: {sum(len(locations) for locations in space_locations.values())}")
+            if total_counts['failed']:
+                print(f"Failed monitors: {total_counts['failed']}")
             print(f"Output directory: {self.output_dir}")
             
             # Show summary by space
-            for space_id in self.spaces:
-                space_locations = [loc for loc in all_location_summary.keys() if f"{space_id}/" in str(self.output_dir / space_id)]
-                if space_locations:
-                    print(f"Space '{space_id}': {len(space_locations)} locations")
+            for space_id, location_counts in space_locations.items():
+                counts = space_counts[space_id]
+                print(f"Space '{space_id}': {counts['exported']} exported, {counts['unchanged']} unchanged, "
+                      f"{counts['failed']} failed, {len(location_counts)} locations")
+                for location_folder, count in sorted(location_counts.items()):
+                    print(f"   - {location_folder}: {count} monitors")
+            
+            if self.manifest is not None and self.manifest.save():
+                print(f"Updated monitor manifest {self.manifest.path} ({len(self.manifest)} files)")
+            
+            if summary_path:
+                write_summary(summary_path, 'export', self.shard, total_counts,
+                              [f"{space_id}: export failed" for space_id in failed_spaces], space_counts)
+                print(f"Wrote run summary to {summary_path}")
+            
+            if failed_spaces:
+                raise Exception(f"spaces failed: {', '.join(failed_spaces)}")
             
             print(f"\nExport completed successfully!")
             
@@ -198,9 +461,25 @@ class SyntheticsExporter:
 
 def main():
     """Main execution function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Export Synthetics Monitors')
+    parser.add_argument('--shard', metavar='I/N', type=Shard.parse,
+                       help='Only export the monitors of shard I of N (0-based), for a CI matrix')
+    parser.add_argument('--summary-out', metavar='PATH',
+                       help='Write the run counts and failures as JSON, for merge-shard-summaries.py')
+    args = parser.parse_args()
+    
     kibana_url = os.getenv('KIBANA_URL')
     api_key = os.getenv('KIBANA_API_KEY')
     kibana_spaces = os.getenv('KIBANA_SPACES', 'default')
+    concurrency = int(os.getenv('EXPORT_CONCURRENCY', '8'))
+    page_size = int(os.getenv('EXPORT_PAGE_SIZE', '50'))
+    parallel_pages = os.getenv('EXPORT_PARALLEL_PAGES', 'true').lower() in ['true', '1', 'yes']
+    incremental = os.getenv('EXPORT_INCREMENTAL', 'true').lower() in ['true', '1', 'yes']
+    prune_deleted = os.getenv('EXPORT_PRUNE_DELETED', 'false').lower() in ['true', '1', 'yes']
+    state_dir = os.getenv('EXPORT_STATE_DIR', '.synthetics-state')
+    parallel_spaces = int(os.getenv('KIBANA_PARALLEL_SPACES', '4'))
     
     if not all([kibana_url, api_key]):
         print("Missing required environment variables:")
@@ -211,9 +490,16 @@ def main():
     # Parse spaces (comma-separated list)
     spaces = [space.strip() for space in kibana_spaces.split(',') if space.strip()]
     print(f"Exporting monitors from spaces: {', '.join(spaces)}")
+    if args.shard:
+        print(f"Shard {args.shard}: exporting only the monitors this shard owns")
     
-    exporter = SyntheticsExporter(kibana_url, api_key, spaces)
-    exporter.export_monitors()
+    exporter = SyntheticsExporter(kibana_url, api_key, spaces, max_workers=concurrency,
+                                  page_size=page_size, parallel_pages=parallel_pages,
+                                  incremental=incremental, prune_deleted=prune_deleted, state_dir=state_dir,
+                                  serializer=MonitorSerializer.from_env(),
+                                  parallel_spaces=parallel_spaces,
+                                  client=KibanaClient.from_env(kibana_url, api_key), shard=args.shard)
+    exporter.export_monitors(summary_path=args.summary_out)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Per-space export progress, so an interrupted export continues instead of refetching everything"""
+
+import json
+import os
+from pathlib import Path
+
+
+class ExportCursor:
+    """Append-only progress log for one space's export
+
+    Every exported monitor appends its state entry (revision, updated_at,
+    files). A run that finds a cursor left behind by an interrupted run
+    loads it and skips monitors whose revision is unchanged; the listing
+    itself is always repeated so deletion detection stays complete. The
+    cursor is deleted once the space completes.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.monitors = {}  # config_id -> state entry of monitors already exported
+        self.file = None
+
+    def load(self):
+        """Load progress left by an interrupted run; returns True if there was any"""
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn write from the interrupted run
+                    if record.get('config_id'):
+                        self.monitors[record['config_id']] = record['state']
+        except OSError as e:
+            print(f"⚠️  Ignoring unreadable export cursor {self.path}: {str(e)}")
+            self.monitors = {}
+            return False
+        return bool(self.monitors)
+
+    def open(self):
+        """Start appending (keeps what load() read so the cursor survives another interruption)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def _append(self, record):
+        self.file.write(json.dumps(record, sort_keys=True, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def record_monitor(self, config_id, state):
+        """Record an exported monitor's state entry"""
+        self.monitors[config_id] = state
+        self._append({'config_id': config_id, 'state': state})
+
+    def close(self):
+        if self.file is not None:
+            os.fsync(self.file.fileno())
+            self.file.close()
+            self.file = None
+
+    def complete(self):
+        """Remove the cursor after the space exported successfully"""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -3,50 +3,90 @@
 import os
 import sys
 import json
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 import re
 
+from import_journal import DEFAULT_JOURNAL_PATH, ImportJournal, hash_files
+from import_plan import ImportPlan
+from kibana_client import KibanaClient
+from monitor_files import (LocationSet, MonitorFile, MonitorSerializer, check_monitor_config, read_monitor_config,
+                           scan_monitor_files, validate_monitor_file, write_if_changed)
+from monitor_manifest import MonitorManifest
+from parallel import bind_output, run_grouped
+from sharding import Shard, write_summary
+
+# Fields a POST/PUT response must carry to be written back without a follow-up GET
+RESPONSE_REQUIRED_FIELDS = ('config_id', 'name', 'type', 'locations')
+
+# Monitor types the project bulk endpoint accepts without a journey bundle, and their target field
+# (UI field -> project monitor field)
+PROJECT_MONITOR_TARGET_FIELDS = {
+    'http': ('url', 'urls'),
+    'tcp': ('host', 'hosts'),
+    'icmp': ('host', 'hosts'),
+}
+
+# Monitor file fields copied into a project monitor definition (UI field -> project monitor field).
+# The project endpoint rejects keys it does not know, so everything else in the file is left out.
+PROJECT_MONITOR_COMMON_FIELDS = {
+    'name': 'name',
+    'enabled': 'enabled',
+    'tags': 'tags',
+    'alert': 'alert',
+    'namespace': 'namespace',
+    'params': 'params',
+    'retest_on_failure': 'retestOnFailure',
+}
+PROJECT_MONITOR_TYPE_FIELDS = {
+    'http': ('timeout', 'max_redirects', 'mode', 'ipv4', 'ipv6', 'proxy_url', 'username', 'password',
+             'check.request.method', 'check.request.headers', 'check.request.body', 'check.response.status',
+             'check.response.headers', 'check.response.body.positive', 'check.response.body.negative',
+             'response.include_body', 'response.include_headers', 'response.include_body_max_bytes',
+             'ssl.verification_mode', 'ssl.supported_protocols'),
+    'tcp': ('timeout', 'proxy_url', 'proxy_use_local_resolver', 'check.send', 'check.receive',
+            'ssl.verification_mode', 'ssl.supported_protocols'),
+    'icmp': ('timeout', 'wait'),
+}
+
 class SyntheticsImporter:
-    def __init__(self, kibana_url, api_key, space_id='default'):
+    def __init__(self, kibana_url, api_key, space_id='default', client=None, max_concurrency=16, parallel_spaces=4,
+                 max_workers=8, page_size=100, skip_unchanged=True, bulk_project=None, bulk_chunk_size=100,
+                 record_plan=False, journal=None, shard=None, manifest=None):
         self.kibana_url = kibana_url.rstrip('/')  # Remove trailing slash
         self.space_id = space_id
         self.monitors_dir = Path('monitors')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'ApiKey {api_key}',
-            'Content-Type': 'application/json',
-            'kbn-xsrf': 'true'
-        })
+        self.serializer = MonitorSerializer.from_env()  # Same file format as the exporter
+        self.parallel_spaces = max(1, int(parallel_spaces))  # Spaces imported concurrently
+        self.max_workers = max(1, int(max_workers))  # Concurrent requests within a space
+        self.page_size = max(1, int(page_size))  # perPage when listing a space's monitors
+        self.skip_unchanged = skip_unchanged  # Skip PUTs that would not change the remote monitor
+        self.bulk_project = bulk_project  # Push eligible monitors through this project's bulk endpoint
+        self.bulk_chunk_size = max(1, int(bulk_chunk_size))  # Monitors per bulk request
+        self.record_plan = record_plan  # Attach plan entries (payload, remote revision) to dry-run results
+        self.journal = journal  # Completed live operations, for --resume
+        self.shard = shard  # Only import monitors this shard owns (see sharding.Shard)
+        self.manifest = manifest  # monitors/index.json: file hashes and the revisions they were synced at
+        # Shared client: pooled connections, global in-flight cap, timeouts and retries
+        self.client = client or KibanaClient(kibana_url, api_key, max_concurrency=max_concurrency)
+
+    def for_space(self, space_id):
+        """Create an importer for another space that shares this importer's client"""
+        return SyntheticsImporter(self.kibana_url, None, space_id, client=self.client,
+                                  parallel_spaces=self.parallel_spaces, max_workers=self.max_workers,
+                                  page_size=self.page_size, skip_unchanged=self.skip_unchanged,
+                                  bulk_project=self.bulk_project, bulk_chunk_size=self.bulk_chunk_size,
+                                  record_plan=self.record_plan, journal=self.journal, shard=self.shard,
+                                  manifest=self.manifest)
 
     def make_request(self, method, endpoint, data=None):
         """Make HTTP request to Kibana API"""
-        url = f"{self.kibana_url}{endpoint}"
+        if method.upper() not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise Exception(f"Unsupported HTTP method: {method}")
         
-        try:
-            if method.upper() == 'GET':
-                response = self.session.get(url)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, json=data)
-            elif method.upper() == 'PUT':
-                response = self.session.put(url, json=data)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url)
-            else:
-                raise Exception(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            
-            # Handle empty responses
-            if response.status_code == 204 or not response.content:
-                return {}
-            
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Request failed: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse JSON response: {str(e)}")
+        return self.client.request_json(method, endpoint, data)
 
     def get_existing_monitor(self, config_id):
         """Get existing monitor configuration if it exists"""
@@ -63,13 +103,63 @@ class SyntheticsImporter:
                 
         except Exception as e:
             # If we get a 404 or similar error, the monitor doesn't exist
-            if "404" in str(e) or "Not Found" in str(e):
+            if getattr(e, 'status_code', None) == 404 or "404" in str(e) or "Not Found" in str(e):
                 print(f"Monitor not found: {config_id}")
                 return None
             else:
                 print(f"Error checking monitor {config_id}: {str(e)}")
                 return None
 
+    def build_monitor_index(self, lookups_needed):
+        """Page through this space's monitor list once and index it by config_id
+
+        Each entry is the list-level monitor (revision, locations, ...). Returns
+        None when listing the space would take more requests than the
+        per-monitor GETs it replaces, or when listing fails.
+        """
+        endpoint = f"/s/{self.space_id}/api/synthetics/monitors?perPage={self.page_size}"
+        try:
+            first_page = self.make_request('GET', f"{endpoint}&page=1")
+            total_monitors = first_page.get('total', 0)
+            total_pages = -(-total_monitors // self.page_size)  # Ceiling division
+            
+            if total_pages - 1 > lookups_needed:
+                print(f"Skipping monitor index: {total_pages} pages for {lookups_needed} lookups")
+                return None
+            
+            print(f"Indexing {total_monitors} existing monitors in space '{self.space_id}' ({total_pages} pages)")
+            pages = [first_page]
+            if total_pages > 1:
+                fetch_page = bind_output(lambda page: self.make_request('GET', f"{endpoint}&page={page}"))
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, total_pages - 1)) as executor:
+                    pages.extend(executor.map(fetch_page, range(2, total_pages + 1)))
+            
+            monitor_index = {}
+            for page in pages:
+                for monitor in page.get('monitors', []):
+                    if monitor.get('config_id'):
+                        monitor_index[monitor['config_id']] = monitor
+            return monitor_index
+        except Exception as e:
+            print(f"⚠️  Could not index monitors in space '{self.space_id}', checking individually: {str(e)}")
+            return None
+
+    def find_existing_monitor(self, config_id, monitor_index=None):
+        """Look a monitor up in the prefetched index, falling back to a single GET"""
+        if monitor_index is None:
+            return self.get_existing_monitor(config_id)
+        
+        existing_monitor = monitor_index.get(config_id)
+        if existing_monitor is None:
+            print(f"Monitor not found: {config_id}")
+            return None
+        if 'locations' not in existing_monitor:
+            # The list entry lacks what the location merge needs; fetch the full monitor
+            return self.get_existing_monitor(config_id)
+        
+        print(f"Monitor exists: {existing_monitor.get('name', 'Unknown')} ({config_id})")
+        return existing_monitor
+
     def get_monitor_config(self, config_id):
         """Fetch detailed configuration for a specific monitor (for export purposes)"""
         try:
@@ -82,21 +172,19 @@ class SyntheticsImporter:
 
     def merge_locations(self, existing_locations, new_locations):
         """Merge existing and new locations, avoiding duplicates"""
-        merged_locations = existing_locations.copy()
+        merged_locations = LocationSet(existing_locations)
         
         for new_location in new_locations:
             new_location_id = new_location.get('id')
-            # Check if this location already exists
-            if not any(loc.get('id') == new_location_id for loc in merged_locations):
-                merged_locations.append(new_location)
+            if merged_locations.add(new_location):
                 print(f"Adding new location: {new_location.get('label', new_location_id)}")
             else:
                 print(f"Location already exists: {new_location.get('label', new_location_id)}")
         
-        return merged_locations
+        return merged_locations.to_list()
 
     def find_monitor_files(self, changed_files_filter=None):
-        """Find monitor JSON files in the monitors directory"""
+        """Find monitor JSON files in the monitors directory (as unparsed MonitorFile records)"""
         monitor_files = []
         
         if not self.monitors_dir.exists():
@@ -116,43 +204,48 @@ class SyntheticsImporter:
                 if file_path.exists() and file_path.suffix == '.json':
                     # Extract space_id and location folder from path (monitors/space_id/location_folder/file.json)
                     if len(file_path.parts) >= 4 and file_path.parts[0] == 'monitors':
-                        space_id = file_path.parts[1]
-                        location_folder = file_path.parts[2]
-                        monitor_files.append({
-                            'file_path': file_path,
-                            'space_id': space_id,
-                            'location_folder': location_folder,
-                            'filename': file_path.name
-                        })
+                        monitor_files.append(MonitorFile(file_path, file_path.parts[1], file_path.parts[2]))
                     else:
                         print(f"  Warning: Skipping {changed_file} - invalid path structure (expected monitors/space_id/location/file.json)")
                 else:
                     print(f"  Warning: Skipping {changed_file} - file not found or not JSON")
         else:
-            # Find all JSON files in space_id/location subdirectories (updated for new structure)
-            for space_dir in self.monitors_dir.iterdir():
-                if space_dir.is_dir():
-                    for location_dir in space_dir.iterdir():
-                        if location_dir.is_dir():
-                            for json_file in location_dir.glob('*.json'):
-                                monitor_files.append({
-                                    'file_path': json_file,
-                                    'space_id': space_dir.name,
-                                    'location_folder': location_dir.name,
-                                    'filename': json_file.name
-                                })
+            # Find all JSON files in space_id/location subdirectories (one scandir per directory)
+            monitor_files = scan_monitor_files(self.monitors_dir)
         
         print(f"Found {len(monitor_files)} monitor files to process")
         return monitor_files
 
+    def attach_headers(self, monitor_files, prune=False):
+        """Give each file its identifying fields without parsing files the manifest already knows
+
+        Files whose hash matches their manifest entry take config_id, name and
+        location ids from it; the others are parsed once while the manifest is
+        refreshed and keep that parsed config for later. Those parsed files
+        are also validated (see monitor_files.check_monitor_config); returns
+        [(file_path, errors)] for the invalid ones.
+        """
+        self.load_manifest()
+        parsed = {}
+        self.manifest.refresh([monitor_file.file_path for monitor_file in monitor_files], prune=prune,
+                              on_parse=lambda file_path, config: parsed.__setitem__(Path(file_path), config))
+        invalid = []
+        for monitor_file in monitor_files:
+            if monitor_file.file_path in parsed:
+                monitor_file.config = parsed[monitor_file.file_path]
+                errors = check_monitor_config(monitor_file.config)
+            else:
+                monitor_file.header = self.manifest.entry(monitor_file.file_path)
+                # No entry means the file could not be parsed; report why
+                errors = [] if monitor_file.header else validate_monitor_file(monitor_file.file_path)[1]
+            if errors:
+                invalid.append((monitor_file.file_path, errors))
+        print(f"Parsed {len(parsed)} new or changed files; {len(monitor_files) - len(parsed)} read from the manifest")
+        return invalid
+
     def load_monitor_config(self, file_path):
         """Load monitor configuration from JSON file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            return config
-        except Exception as e:
-            raise Exception(f"Failed to load monitor config from {file_path}: {str(e)}")
+        return read_monitor_config(file_path)
 
     def prepare_monitor_for_create(self, config):
         """Prepare monitor configuration for creation by removing specific fields"""
@@ -190,6 +283,44 @@ class SyntheticsImporter:
         
         return update_config
 
+    def _comparable_value(self, key, value):
+        """Normalize a field value for comparison (locations compare by id, order-insensitive)"""
+        if key == 'locations' and isinstance(value, list):
+            return sorted(str(location.get('id')) for location in value if isinstance(location, dict))
+        return json.dumps(value, sort_keys=True)
+
+    def compare_with_remote(self, config, remote_config):
+        """Compare a local config with the remote monitor using the update strip rules
+
+        Returns True if a PUT would change nothing, False if any field differs,
+        or None if the remote config lacks fields the PUT would send (so the
+        full monitor is needed to decide).
+        """
+        update_payload = self.prepare_monitor_for_update(config)
+        remote_payload = self.prepare_monitor_for_update(remote_config)
+        
+        missing_fields = False
+        for key, value in update_payload.items():
+            if key not in remote_payload:
+                missing_fields = True
+                continue
+            if self._comparable_value(key, value) != self._comparable_value(key, remote_payload[key]):
+                return False
+        
+        return None if missing_fields else True
+
+    def matches_remote(self, config_id, config, existing_monitor):
+        """Check whether the remote monitor already equals config, fetching full detail only if needed"""
+        # Files untouched since they were written from this very revision match without comparing
+        if self.manifest is not None and self.manifest.is_synced(self.space_id, config_id,
+                                                                 existing_monitor.get('revision')):
+            return True
+        matches = self.compare_with_remote(config, existing_monitor)
+        if matches is None:
+            remote_config = self.get_monitor_config(config_id)
+            matches = self.compare_with_remote(config, remote_config) if remote_config else False
+        return bool(matches)
+
     def create_monitor(self, config):
         """Create a new monitor"""
         endpoint = f"/s/{self.space_id}/api/synthetics/monitors"
@@ -224,6 +355,300 @@ class SyntheticsImporter:
 
 
 
+    def write_back_ids(self, file_paths, create_response):
+        """Record a created monitor's config_id/id in its source files right away
+
+        Without this a rerun before the export step succeeds would create the
+        monitor again. Each file is rewritten atomically; failures are only
+        reported since the monitor itself was created.
+        """
+        config_id = create_response.get('config_id') or create_response.get('id')
+        monitor_id = create_response.get('id') or config_id
+        if not config_id:
+            return
+        
+        for file_path in file_paths:
+            try:
+                config = self.load_monitor_config(file_path)
+                if config.get('config_id') == config_id and config.get('id') == monitor_id:
+                    continue
+                config['config_id'] = config_id
+                config['id'] = monitor_id
+                content = self.serializer.serialize(config)
+                write_if_changed(file_path, content)
+                if self.manifest is not None:
+                    self.manifest.record(file_path, config, content=content)
+                print(f"📝 Recorded config_id {config_id} in {file_path}")
+            except Exception as e:
+                print(f"⚠️  Could not record config_id {config_id} in {file_path}: {str(e)}")
+
+    def is_project_monitor(self, monitor):
+        """Check whether an existing monitor belongs to the bulk import project"""
+        return monitor.get('origin') == 'project' and monitor.get('project_id') == self.bulk_project
+
+    def to_project_monitor(self, config, existing_monitor=None):
+        """Convert a monitor file config into a project monitor definition
+
+        Returns (project_monitor, None), or (None, reason) when the monitor has
+        to go through the per-monitor API instead.
+        """
+        monitor_type = config.get('type')
+        if monitor_type not in PROJECT_MONITOR_TARGET_FIELDS:
+            return None, f"{monitor_type} monitors need a project bundle"
+        
+        schedule = config.get('schedule') or {}
+        if schedule.get('unit', 'm') != 'm':
+            return None, "schedule is not in whole minutes"
+        try:
+            schedule_minutes = int(schedule.get('number', 3))
+        except (TypeError, ValueError):
+            return None, f"invalid schedule {schedule}"
+        
+        monitor_id = ((existing_monitor or {}).get('journey_id') or config.get('journey_id') or
+                      self.sanitize_filename(config.get('name', '')))
+        if not monitor_id:
+            return None, "no project monitor id"
+        
+        params = config.get('params')
+        if isinstance(params, str):
+            # The UI keeps params as a JSON string; project monitors take an object
+            try:
+                params = json.loads(params) if params.strip() else None
+            except json.JSONDecodeError:
+                return None, "params is not valid JSON"
+        if params is not None and not isinstance(params, dict):
+            return None, "params is not an object"
+        
+        fields = dict(PROJECT_MONITOR_COMMON_FIELDS)
+        fields.update((field, field) for field in PROJECT_MONITOR_TYPE_FIELDS[monitor_type])
+        project_monitor = {'type': monitor_type, 'id': monitor_id, 'schedule': schedule_minutes}
+        for field, project_field in fields.items():
+            value = params if field == 'params' else config.get(field)
+            if field == 'check.request.body' and isinstance(value, dict):
+                value = value.get('value')  # UI form {type, value}
+            # UI files carry empty strings and objects for every unset field
+            if value not in (None, '', {}, []):
+                project_monitor[project_field] = value
+        
+        target_field, project_target_field = PROJECT_MONITOR_TARGET_FIELDS[monitor_type]
+        if config.get(target_field):
+            project_monitor[project_target_field] = config[target_field]
+        
+        # Elastic-managed locations are referenced by id, private locations by label
+        locations = config.get('locations', [])
+        project_monitor['locations'] = [location.get('id') for location in locations
+                                        if location.get('isServiceManaged', True)]
+        project_monitor['privateLocations'] = [location.get('label') or location.get('id') for location in locations
+                                               if not location.get('isServiceManaged', True)]
+        return project_monitor, None
+
+    def push_project_monitors(self, project_monitors):
+        """Upsert project monitors through the bulk endpoint in chunks
+
+        A chunk the endpoint rejects as a whole is pushed again one monitor
+        per request, so one bad monitor does not fail the others. Returns
+        {project monitor id: (status, error)} with status 'created',
+        'updated' or 'failed'.
+        """
+        endpoint = f"/s/{self.space_id}/api/synthetics/project/{quote(self.bulk_project, safe='')}/monitors"
+        outcomes = {}
+        chunks = [project_monitors[start:start + self.bulk_chunk_size]
+                  for start in range(0, len(project_monitors), self.bulk_chunk_size)]
+        
+        # Chunks go one at a time so two pushes never write the same project concurrently
+        while chunks:
+            chunk = chunks.pop(0)
+            print(f"Pushing {len(chunk)} monitors to project '{self.bulk_project}'")
+            try:
+                response = self.make_request('PUT', endpoint, {'monitors': chunk})
+            except Exception as e:
+                if len(chunk) > 1:
+                    print(f"⚠️  Bulk request failed, pushing its {len(chunk)} monitors one at a time: {str(e)}")
+                    chunks[:0] = [[project_monitor] for project_monitor in chunk]
+                    continue
+                print(f"❌ Bulk request failed: {str(e)}")
+                outcomes[chunk[0]['id']] = ('failed', str(e))
+                continue
+            
+            for monitor_id in response.get('createdMonitors', []):
+                outcomes[monitor_id] = ('created', None)
+            for monitor_id in response.get('updatedMonitors', []):
+                outcomes[monitor_id] = ('updated', None)
+            for failure in response.get('failedMonitors', []):
+                error = failure.get('reason', 'Unknown error')
+                if failure.get('details'):
+                    error = f"{error}: {failure['details']}"
+                outcomes[failure.get('id')] = ('failed', error)
+            for project_monitor in chunk:
+                outcomes.setdefault(project_monitor['id'], ('failed', 'Missing from bulk response'))
+        
+        return outcomes
+
+    def list_project_monitors(self):
+        """List this space's monitors that belong to the bulk import project, keyed by project monitor id"""
+        endpoint = (f"/s/{self.space_id}/api/synthetics/monitors?perPage={self.page_size}"
+                    f"&projects={quote(self.bulk_project, safe='')}")
+        project_monitors = {}
+        page = 1
+        try:
+            while True:
+                response = self.make_request('GET', f"{endpoint}&page={page}")
+                monitors = response.get('monitors', [])
+                for monitor in monitors:
+                    if monitor.get('journey_id') and self.is_project_monitor(monitor):
+                        project_monitors[monitor['journey_id']] = monitor
+                if not monitors or page * self.page_size >= response.get('total', 0):
+                    break
+                page += 1
+        except Exception as e:
+            print(f"⚠️  Could not list project monitors, config IDs will be resolved later: {str(e)}")
+        return project_monitors
+
+    def _import_bulk(self, new_monitors, processed_configs, results, dry_run=False, fresh_import=False,
+                     monitor_index=None):
+        """Push every eligible monitor through the project bulk endpoint
+
+        New monitors and monitors already owned by the project are eligible;
+        browser monitors, sub-minute schedules and monitors created outside
+        the project are returned (as new_monitors, processed_configs) for the
+        per-monitor passes.
+        """
+        print(f"\n=== Bulk import through project '{self.bulk_project}' ===")
+        batch = {}  # project monitor id -> monitor being pushed
+        remaining_new_monitors = []
+        remaining_configs = {}
+        
+        for new_monitor in new_monitors:
+            config = new_monitor['file_info'].config
+            project_monitor, reason = self.to_project_monitor(config)
+            if project_monitor is not None and project_monitor['id'] in batch:
+                project_monitor, reason = None, f"duplicate project monitor id {project_monitor['id']}"
+            if project_monitor is None:
+                print(f"Per-monitor import for {config.get('name', 'Unknown')}: {reason}")
+                remaining_new_monitors.append(new_monitor)
+                continue
+            batch[project_monitor['id']] = {
+                'name': config.get('name', 'Unknown'),
+                'config_id': None,
+                'file': str(new_monitor['file_info'].file_path),
+                'files': [new_monitor['file_info'].file_path],
+                'project_monitor': project_monitor,
+                'new_monitor': new_monitor
+            }
+        
+        for config_id, monitor_data in processed_configs.items():
+            config = self.monitor_config(monitor_data)
+            monitor_name = config.get('name', 'Unknown')
+            file_path = str(monitor_data['files'][0].file_path) if monitor_data['files'] else None
+            existing_monitor = None if fresh_import else self.find_existing_monitor(config_id, monitor_index)
+            
+            if existing_monitor and not self.is_project_monitor(existing_monitor):
+                print(f"Per-monitor import for {monitor_name}: not managed by project '{self.bulk_project}'")
+                remaining_configs[config_id] = monitor_data
+                continue
+            
+            if existing_monitor:
+                config = config.copy()
+                config['locations'] = self.merge_locations(existing_monitor.get('locations', []),
+                                                           config.get('locations', []))
+                if self.skip_unchanged and self.matches_remote(config_id, config, existing_monitor):
+                    print(f"⏭️  No changes for {monitor_name}, skipping update")
+                    results['skipped'].append({
+                        'name': monitor_name,
+                        'config_id': config_id,
+                        'file': file_path,
+                        'reason': 'unchanged in Kibana'
+                    })
+                    continue
+            
+            project_monitor, reason = self.to_project_monitor(config, existing_monitor)
+            if project_monitor is not None and project_monitor['id'] in batch:
+                project_monitor, reason = None, f"duplicate project monitor id {project_monitor['id']}"
+            if project_monitor is None:
+                print(f"Per-monitor import for {monitor_name}: {reason}")
+                remaining_configs[config_id] = monitor_data
+                continue
+            batch[project_monitor['id']] = {
+                'name': monitor_name,
+                'config_id': config_id if existing_monitor else None,
+                'file': file_path,
+                'files': [file_info.file_path for file_info in monitor_data['files']],
+                'project_monitor': project_monitor,
+                'source_config_id': config_id,
+                'monitor_data': monitor_data
+            }
+        
+        if not batch:
+            print("No monitors eligible for bulk import")
+            return remaining_new_monitors, remaining_configs
+        
+        requests_needed = -(-len(batch) // self.bulk_chunk_size)  # Ceiling division
+        if dry_run:
+            print(f"[DRY RUN] Would push {len(batch)} monitors in {requests_needed} bulk requests")
+            for entry in batch.values():
+                bucket = 'updated' if entry['config_id'] else 'created'
+                results[bucket].append({
+                    'name': entry['name'],
+                    'config_id': entry['config_id'] or 'new',
+                    'file': entry['file']
+                })
+            return remaining_new_monitors, remaining_configs
+        
+        print(f"Pushing {len(batch)} monitors in {requests_needed} bulk requests")
+        outcomes = self.push_project_monitors([entry['project_monitor'] for entry in batch.values()])
+        
+        # The bulk response only carries project monitor ids; resolve config_ids with one listing
+        listed_monitors = {}
+        if any(status != 'failed' for status, _ in outcomes.values()):
+            listed_monitors = self.list_project_monitors()
+        
+        for monitor_id, entry in batch.items():
+            status, error = outcomes[monitor_id]
+            if status == 'failed' and not entry['config_id']:
+                # Not in Kibana yet, so the per-monitor API can still create it
+                print(f"⚠️  Bulk import failed for {entry['name']}, using the per-monitor API: {error}")
+                if 'new_monitor' in entry:
+                    remaining_new_monitors.append(entry['new_monitor'])
+                else:
+                    remaining_configs[entry['source_config_id']] = entry['monitor_data']
+                continue
+            if status == 'failed':
+                print(f"❌ Bulk import failed for {entry['name']}: {error}")
+                results['failed'].append({
+                    'name': entry['name'],
+                    'config_id': entry['config_id'],
+                    'operation': 'bulk_upsert',
+                    'error': error,
+                    'file': entry['file']
+                })
+                continue
+            
+            listed_monitor = listed_monitors.get(monitor_id)
+            config_id = (listed_monitor or {}).get('config_id') or entry['config_id'] or 'new'
+            print(f"✅ Bulk {status}: {entry['name']} ({config_id})")
+            if status == 'created' and listed_monitor:
+                self.write_back_ids(entry['files'], listed_monitor)
+            results[status].append({
+                'name': entry['name'],
+                'config_id': config_id,
+                'operation': f'bulk_{status[:-1]}',
+                'file': entry['file'],
+                'response': listed_monitor
+            })
+        
+        return remaining_new_monitors, remaining_configs
+
+    def is_complete_monitor_response(self, response, config_id):
+        """Check that a POST/PUT response carries everything export_imported_monitors writes to files"""
+        if not isinstance(response, dict) or response.get('config_id', response.get('id')) != config_id:
+            return False
+        if any(field not in response for field in RESPONSE_REQUIRED_FIELDS):
+            return False
+        locations = response.get('locations')
+        return (isinstance(locations, list) and
+                all(isinstance(location, dict) and 'id' in location and 'label' in location
+                    for location in locations))
+
     def sanitize_filename(self, name):
         """Sanitize filename by replacing invalid characters"""
         return re.sub(r'[^a-zA-Z0-9.-]', '_', name)
@@ -237,6 +662,7 @@ class SyntheticsImporter:
                 - space_id: The Kibana space ID
                 - original_file_path: Full path to the original file that was imported
                 - monitor_name: Name of the monitor from Kibana
+                - response: (optional) POST/PUT response body, written as-is when complete
         """
         if dry_run:
             print("\n[DRY RUN] Skipping export of imported monitors")
@@ -248,8 +674,11 @@ class SyntheticsImporter:
         
         export_summary = {
             'updated_files': [],
+            'unchanged_files': [],
             'renamed_files': [],
-            'failed_exports': []
+            'failed_exports': [],
+            'reused_responses': 0,
+            'fetched_configs': 0
         }
         
         if not monitor_list:
@@ -272,16 +701,17 @@ class SyntheticsImporter:
                 print(f"\nExporting monitor: {monitor_name} ({config_id}) in space: {space_id}")
                 print(f"Original file: {original_file_path}")
                 
-                # Create space-specific importer
-                space_importer = SyntheticsImporter(
-                    self.kibana_url,
-                    self.session.headers['Authorization'].replace('ApiKey ', ''),
-                    space_id
-                )
+                # Create space-specific importer (shares this importer's connection pool)
+                space_importer = self.for_space(space_id)
                 
-                # Fetch latest config from Kibana
+                # The create/update response already holds the saved monitor; only GET when it is incomplete
                 try:
-                    latest_config = space_importer.get_monitor_config(config_id)
+                    latest_config = monitor_info.get('response')
+                    if self.is_complete_monitor_response(latest_config, config_id):
+                        export_summary['reused_responses'] += 1
+                    else:
+                        latest_config = space_importer.get_monitor_config(config_id)
+                        export_summary['fetched_configs'] += 1
                     if not latest_config:
                         print(f"❌ Failed to fetch config for {monitor_name}")
                         export_summary['failed_exports'].append({
@@ -354,6 +784,8 @@ class SyntheticsImporter:
                                 # Rename the file
                                 original_path.rename(correct_file_path)
                                 print(f"🔄 Renamed: {original_path.name} → {correct_filename}")
+                            if self.manifest is not None:
+                                self.manifest.remove(original_path)
                             renamed = True
                             export_summary['renamed_files'].append({
                                 'old_name': original_path.name,
@@ -363,16 +795,28 @@ class SyntheticsImporter:
                         except Exception as e:
                             print(f"⚠️  Failed to rename {original_path.name}: {str(e)}")
                     
-                    # Write the updated config for this location
+                    # Write the updated config for this location (skipped if the content is identical)
                     try:
-                        with open(correct_file_path, 'w', encoding='utf-8') as f:
-                            json.dump(location_specific_config, f, indent=2, ensure_ascii=False)
+                        content = self.serializer.serialize(location_specific_config)
+                        file_written = write_if_changed(correct_file_path, content)
+                        if self.manifest is not None:
+                            self.manifest.record(correct_file_path, location_specific_config,
+                                                 latest_config.get('revision'), content)
                         
-                        print(f"✅ Exported: {monitor_name} → {space_id}/{location_folder}/{correct_filename}")
+                        if file_written:
+                            print(f"✅ Exported: {monitor_name} → {space_id}/{location_folder}/{correct_filename}")
+                        else:
+                            print(f"✅ Unchanged: {monitor_name} → {space_id}/{location_folder}/{correct_filename}")
                         
                         if renamed:
                             # File was renamed - already tracked
                             pass
+                        elif not file_written:
+                            export_summary['unchanged_files'].append({
+                                'monitor': monitor_name,
+                                'config_id': config_id,
+                                'file_path': str(correct_file_path)
+                            })
                         else:
                             # File was updated
                             export_summary['updated_files'].append({
@@ -403,8 +847,11 @@ class SyntheticsImporter:
         print("EXPORT SUMMARY")
         print(f"{'='*60}")
         print(f"Files updated: {len(export_summary['updated_files'])}")
+        print(f"Files unchanged: {len(export_summary['unchanged_files'])}")
         print(f"Files renamed: {len(export_summary['renamed_files'])}")
         print(f"Failed exports: {len(export_summary['failed_exports'])}")
+        print(f"Configs from create/update responses: {export_summary['reused_responses']}")
+        print(f"Configs fetched from Kibana: {export_summary['fetched_configs']}")
         
         if export_summary['updated_files']:
             print(f"\nUpdated files:")
@@ -424,8 +871,8 @@ class SyntheticsImporter:
         print(f"\nExport completed!")
         return export_summary
 
-    def import_monitors(self, dry_run=False, changed_files_filter=None, fresh_import=False):
-        """Main import function"""
+    def import_monitors(self, dry_run=False, changed_files_filter=None, fresh_import=False, plan_path=None):
+        """Main import function (with plan_path, a dry run also writes its decisions as an import plan)"""
         try:
             # Find monitor files
             all_monitor_files = self.find_monitor_files(changed_files_filter)
@@ -434,48 +881,50 @@ class SyntheticsImporter:
                 print("No monitor files found to import")
                 return
             
-            # Group files by space ID
+            # Hash the files against the manifest; edited files lose their synced revision
+            invalid = self.attach_headers(all_monitor_files, prune=not changed_files_filter)
+            
+            # Bad files fail here, before any request, rather than as rejected POST/PUTs halfway through
+            if invalid:
+                print(f"\n❌ {len(invalid)} monitor files are invalid; nothing was sent to Kibana:")
+                for file_path, errors in invalid:
+                    print(f"   {file_path}")
+                    for error in errors:
+                        print(f"     - {error}")
+                sys.exit(1)
+            
+            # Group files by space ID (taken from the path: monitors/space_id/location/file.json)
             files_by_space = {}
-            for file_info in all_monitor_files:
-                # Determine space ID for this file
-                space_id = None
-                
-                # First try to get space_id from file path (new structure)
-                if 'space_id' in file_info:
-                    space_id = file_info['space_id']
-                else:
-                    # Fallback: check spaceId from JSON content
-                    try:
-                        config = self.load_monitor_config(file_info['file_path'])
-                        space_id = config.get('spaceId', 'default')
-                        file_info['space_id'] = space_id  # Add space_id to file_info
-                    except Exception as e:
-                        print(f"Warning: Could not read spaceId from {file_info['filename']}: {e}")
-                        space_id = 'default'
-                        file_info['space_id'] = space_id
-                
-                # Group by space ID
-                if space_id not in files_by_space:
-                    files_by_space[space_id] = []
-                files_by_space[space_id].append(file_info)
+            for monitor_file in all_monitor_files:
+                files_by_space.setdefault(monitor_file.space_id, []).append(monitor_file)
             
             print(f"Found files for {len(files_by_space)} space(s): {list(files_by_space.keys())}")
             
-            # Process each space separately
-            all_results = {}
-            for space_id, monitor_files in files_by_space.items():
+            def process_space(space_id):
+                monitor_files = files_by_space[space_id]
                 print(f"\n{'='*60}")
                 print(f"Processing space: {space_id}")
                 print(f"Files: {len(monitor_files)}")
                 print(f"{'='*60}")
                 
-                # Create a new importer instance for this space
-                space_importer = SyntheticsImporter(self.kibana_url.rstrip('/'),
-                                                  self.session.headers['Authorization'].replace('ApiKey ', ''),
-                                                  space_id)
-                
-                # Process monitors for this space
-                space_results = space_importer._process_space_monitors(monitor_files, dry_run, fresh_import)
+                # Space-specific importer sharing the connection pool and global request cap
+                space_importer = self.for_space(space_id)
+                return space_importer._process_space_monitors(monitor_files, dry_run, fresh_import)
+            
+            # Process spaces concurrently; each space's output is printed as one block
+            if len(files_by_space) > 1:
+                print(f"Importing {len(files_by_space)} spaces, {self.parallel_spaces} at a time")
+            all_results = {}
+            for space_id, space_results, error in run_grouped(process_space, list(files_by_space), self.parallel_spaces):
+                if error is not None:
+                    print(f"Processing space {space_id} failed: {str(error)}")
+                    space_results = {
+                        'created': [],
+                        'updated': [],
+                        'failed': [{'error': str(error)}],
+                        'skipped': [],
+                        'other_shard': []
+                    }
                 all_results[space_id] = space_results
             
             # Print overall summary
@@ -483,40 +932,9 @@ class SyntheticsImporter:
             
             # Export imported monitors back to files with latest Kibana config
             if not dry_run:
-                # Build monitor list for export
-                monitor_list = []
-                for space_id, results in all_results.items():
-                    # Process created monitors
-                    for created_monitor in results.get('created', []):
-                        config_id = created_monitor.get('config_id')
-                        if config_id and config_id != 'new':
-                            monitor_list.append({
-                                'config_id': config_id,
-                                'space_id': space_id,
-                                'original_file_path': created_monitor.get('file'),
-                                'monitor_name': created_monitor.get('name')
-                            })
-                    
-                    # Process updated monitors
-                    for updated_monitor in results.get('updated', []):
-                        config_id = updated_monitor.get('config_id')
-                        if config_id and config_id != 'new':
-                            monitor_list.append({
-                                'config_id': config_id,
-                                'space_id': space_id,
-                                'original_file_path': updated_monitor.get('file'),
-                                'monitor_name': updated_monitor.get('name')
-                            })
-                
-                if monitor_list:
-                    print(f"\n🔄 Starting export of {len(monitor_list)} successfully imported monitors...")
-                    try:
-                        self.export_imported_monitors(monitor_list, dry_run)
-                    except Exception as e:
-                        print(f"⚠️  Export failed but import was successful: {str(e)}")
-                        # Don't fail the entire workflow if export fails
-                else:
-                    print(f"\n📝 No successful imports to export")
+                self._export_results(all_results)
+            elif plan_path:
+                self._save_plan(all_results, plan_path, fresh_import)
             
             return all_results
             
@@ -524,6 +942,559 @@ class SyntheticsImporter:
             print(f"Import failed: {str(e)}")
             sys.exit(1)
     
+    def load_manifest(self):
+        """Load monitors/index.json unless a manifest was already given"""
+        if self.manifest is None:
+            self.manifest = MonitorManifest.load(self.monitors_dir / 'index.json')
+        return self.manifest
+
+    def _export_results(self, all_results):
+        """Write successfully created/updated monitors back to their files"""
+        # Build monitor list for export
+        monitor_list = []
+        for space_id, results in all_results.items():
+            # Process created monitors
+            for created_monitor in results.get('created', []):
+                config_id = created_monitor.get('config_id')
+                if config_id and config_id != 'new':
+                    monitor_list.append({
+                        'config_id': config_id,
+                        'space_id': space_id,
+                        'original_file_path': created_monitor.get('file'),
+                        'monitor_name': created_monitor.get('name'),
+                        'response': created_monitor.get('response')
+                    })
+            
+            # Process updated monitors
+            for updated_monitor in results.get('updated', []):
+                config_id = updated_monitor.get('config_id')
+                if config_id and config_id != 'new':
+                    monitor_list.append({
+                        'config_id': config_id,
+                        'space_id': space_id,
+                        'original_file_path': updated_monitor.get('file'),
+                        'monitor_name': updated_monitor.get('name'),
+                        'response': updated_monitor.get('response')
+                    })
+        
+        if monitor_list:
+            print(f"\n🔄 Starting export of {len(monitor_list)} successfully imported monitors...")
+            try:
+                self.export_imported_monitors(monitor_list)
+            except Exception as e:
+                print(f"⚠️  Export failed but import was successful: {str(e)}")
+                # Don't fail the entire workflow if export fails
+        else:
+            print(f"\n📝 No successful imports to export")
+        
+        # Shards would overwrite each other's manifest; monitor_manifest.py catches up after a sharded run
+        if self.manifest is not None and not self.shard and self.manifest.save():
+            print(f"Updated monitor manifest {self.manifest.path} ({len(self.manifest)} files)")
+
+    def _save_plan(self, all_results, plan_path, fresh_import=False):
+        """Collect the plan entries attached to dry-run results and write them to plan_path"""
+        plan = ImportPlan(self.kibana_url, fresh_import=fresh_import)
+        failed = 0
+        for space_id, results in all_results.items():
+            for bucket in ('created', 'updated', 'skipped'):
+                for item in results.get(bucket, []):
+                    if item.get('plan'):
+                        plan.add(space_id, item['plan'])
+            failed += len(results.get('failed', []))
+        
+        plan.save(plan_path)
+        counts = plan.counts()
+        print(f"\n📝 Import plan written to {plan_path}: {counts['create']} creates, "
+              f"{counts['update']} updates, {counts['noop']} no-ops")
+        if failed:
+            print(f"⚠️  {failed} operations failed while planning and are not part of the plan")
+
+    def apply_plan(self, plan):
+        """Execute a saved import plan exactly, refusing to start if Kibana or its files changed since it was made"""
+        if plan.kibana_url != self.kibana_url:
+            print(f"❌ Plan was made against {plan.kibana_url}, not {self.kibana_url}; refusing to apply")
+            sys.exit(1)
+        
+        self.load_manifest()
+        entries_by_space = plan.entries_by_space()
+        counts = plan.counts()
+        print(f"Applying plan from {plan.created_at}: {counts['create']} creates, "
+              f"{counts['update']} updates, {counts['noop']} no-ops in {len(entries_by_space)} space(s)")
+        
+        # Check every space before writing anything so a stale plan is never half-applied
+        drift = []
+        check_space = lambda space_id: self.for_space(space_id)._check_plan_drift(entries_by_space[space_id])
+        for space_id, problems, error in run_grouped(check_space, list(entries_by_space), self.parallel_spaces):
+            if error is not None:
+                problems = [f"could not check remote revisions: {str(error)}"]
+            drift.extend(f"{space_id}: {problem}" for problem in problems)
+        
+        if drift:
+            print(f"\n❌ Kibana or the monitor files changed since the plan was made, or it was already applied; "
+                  f"refusing to apply ({len(drift)} conflicts):")
+            for problem in drift:
+                print(f"   - {problem}")
+            print("Re-run the dry run to make a new plan.")
+            sys.exit(1)
+        
+        def apply_space(space_id):
+            print(f"\n{'='*60}")
+            print(f"Applying plan for space: {space_id}")
+            print(f"{'='*60}")
+            space_results = {'created': [], 'updated': [], 'failed': [], 'skipped': []}
+            space_importer = self.for_space(space_id)
+            space_importer._run_operations(space_importer._apply_plan_entry, entries_by_space[space_id],
+                                           space_results)
+            return space_results
+        
+        all_results = {}
+        for space_id, space_results, error in run_grouped(apply_space, list(entries_by_space), self.parallel_spaces):
+            if error is not None:
+                print(f"Applying plan for space {space_id} failed: {str(error)}")
+                space_results = {'created': [], 'updated': [], 'failed': [{'error': str(error)}], 'skipped': []}
+            all_results[space_id] = space_results
+        
+        self._print_overall_summary(all_results, False, plan.fresh_import)
+        self._export_results(all_results)
+        return all_results
+
+    def _check_plan_files(self, entries):
+        """Check that the source files of planned creates are as planned; returns a list of conflicts
+
+        Creates of new files have no remote state to compare, and a fresh
+        create is not expected to be absent, so only their files show whether
+        the plan (or part of it) was already applied.
+        """
+        problems = []
+        for entry in entries:
+            if entry['action'] != 'create':
+                continue
+            label = f"{entry['name']} ({entry['config_id'] or 'new'})"
+            try:
+                if hash_files(entry['files']) == entry['files_hash']:
+                    continue
+                created_ids = {self.load_monitor_config(file_path).get('config_id')
+                               for file_path in entry['files']} - {None, entry['config_id']}
+            except Exception:
+                problems.append(f"{label}: source files are missing or unreadable")
+                continue
+            if created_ids:
+                problems.append(f"{label} was already created as {', '.join(sorted(created_ids))}")
+            else:
+                problems.append(f"{label}: source files changed after the plan was made")
+        return problems
+
+    def _check_plan_drift(self, entries):
+        """Compare plan entries with their files and the remote revisions with Kibana; returns a list of conflicts"""
+        problems = self._check_plan_files(entries)
+        to_check = [entry for entry in entries
+                    if entry['config_id'] and (entry['action'] != 'create' or entry['expect_absent'])]
+        if not to_check:
+            return problems
+        
+        monitor_index = self.build_monitor_index(len(to_check))
+        for entry in to_check:
+            existing_monitor = self.find_existing_monitor(entry['config_id'], monitor_index)
+            label = f"{entry['name']} ({entry['config_id']})"
+            if entry['action'] == 'create':
+                if existing_monitor:
+                    problems.append(f"{label} was created after the plan was made")
+            elif not existing_monitor:
+                problems.append(f"{label} was deleted after the plan was made")
+            elif existing_monitor.get('revision') != entry['remote_revision']:
+                problems.append(f"{label} changed from revision {entry['remote_revision']} "
+                                f"to {existing_monitor.get('revision')}")
+        return problems
+
+    def _apply_plan_entry(self, entry, results):
+        """Send one planned operation with its recorded payload"""
+        monitor_name = entry['name']
+        config_id = entry['config_id']
+        file_path = entry['files'][0] if entry['files'] else None
+        
+        if entry['action'] == 'noop':
+            print(f"⏭️  No changes for {monitor_name} (planned)")
+            results['skipped'].append({
+                'name': monitor_name,
+                'config_id': config_id,
+                'file': file_path,
+                'reason': 'unchanged in Kibana'
+            })
+            return
+        
+        if entry['action'] == 'update':
+            response = self.update_monitor(config_id, entry['payload'])
+            bucket, operation = 'updated', 'plan_update'
+        else:
+            response = self.create_monitor(entry['payload'])
+            bucket, operation = 'created', 'plan_create'
+            if response is not None:
+                config_id = response.get('config_id') or response.get('id') or config_id
+                self.write_back_ids(entry['files'], response)
+        
+        if response is None:
+            results['failed'].append({
+                'name': monitor_name,
+                'config_id': config_id,
+                'operation': operation,
+                'file': file_path
+            })
+            return
+        
+        print(f"✅ {bucket.capitalize()}: {monitor_name} ({config_id})")
+        results[bucket].append({
+            'name': monitor_name,
+            'config_id': config_id or 'new',
+            'operation': operation,
+            'file': file_path,
+            'response': response
+        })
+
+    def _plan_entry(self, action, config_id, monitor_name, files, config, existing_monitor=None,
+                    expect_absent=False):
+        """Build the plan entry for a dry-run decision (None unless a plan is being recorded)"""
+        if not self.record_plan:
+            return None
+        if action == 'create':
+            payload = self.prepare_monitor_for_create(config)
+        else:
+            payload = self.prepare_monitor_for_update(config)
+        file_paths = [getattr(file_info, 'file_path', file_info) for file_info in files]
+        remote_revision = existing_monitor.get('revision') if existing_monitor else None
+        # A create that was applied writes its new config_id into the files, so their hash shows it
+        files_hash = hash_files(file_paths) if action == 'create' else None
+        return ImportPlan.make_entry(action, config_id, monitor_name, file_paths, payload,
+                                     remote_revision=remote_revision, expect_absent=expect_absent,
+                                     files_hash=files_hash)
+
+    def _run_operations(self, operation, items, results, **kwargs):
+        """Run operation(item, item_results, **kwargs) for each item on the worker pool
+
+        Each item is one monitor (one config_id), so every create/update for a
+        config_id stays on a single worker and happens in order. Each call fills
+        its own result buckets, which are merged into results in input order,
+        and its output is printed as one block.
+        """
+        def run(item):
+            item_results = {bucket: [] for bucket in results}
+            operation(item, item_results, **kwargs)
+            return item_results
+        
+        for item, item_results, error in run_grouped(run, items, self.max_workers):
+            if error is not None:
+                results['failed'].append({'error': str(error)})
+                continue
+            for bucket, entries in item_results.items():
+                results[bucket].extend(entries)
+
+    def _journal_key(self, file_paths):
+        """Journal key for a monitor's source files, or None when no journal is kept"""
+        if self.journal is None:
+            return None
+        return ImportJournal.key(self.space_id, file_paths)
+
+    def _resume_from_journal(self, journal_key, file_paths, monitor_name, results, config_id=None):
+        """Report an operation the interrupted run already completed; returns True if there was one
+
+        A create is never repeated, whether its files are found by path or by
+        the config_id written back into them. An update or no-op is only taken from the
+        journal while the files still hash as they did when it was recorded;
+        otherwise it is compared with Kibana again (repeating it is harmless).
+        """
+        if not journal_key:
+            return False
+        entry = self.journal.get(journal_key)
+        if entry is None and config_id:
+            entry = self.journal.get_created(self.space_id, config_id)
+        if entry is None:
+            return False
+        if entry['bucket'] != 'created':
+            try:
+                if hash_files(file_paths) != entry.get('files_hash'):
+                    return False
+            except OSError:
+                return False
+        print(f"⏭️  Already {entry['bucket']} before the interruption: {monitor_name} ({entry['config_id']})")
+        result = {
+            'name': monitor_name,
+            'config_id': entry['config_id'],
+            'operation': 'resumed',
+            'file': str(file_paths[0]) if file_paths else None
+        }
+        if entry['bucket'] == 'skipped':
+            result['reason'] = 'unchanged in Kibana'
+        results[entry['bucket']].append(result)
+        return True
+
+    def _journal_record(self, journal_key, bucket, config_id, monitor_name, file_paths):
+        """Append a completed operation to the journal (if one is kept), with the hash of its files as they are now"""
+        if journal_key:
+            self.journal.record(journal_key, bucket, config_id, monitor_name, files_hash=hash_files(file_paths))
+
+    def _import_new_monitor(self, new_monitor, results, dry_run=False):
+        """Create one monitor that has no config_id yet (second pass)"""
+        try:
+            file_info = new_monitor['file_info']
+            config = file_info.config
+            monitor_name = config.get('name', 'Unknown')
+            locations = config.get('locations', [])
+            
+            print(f"\nCreating new monitor: {monitor_name}")
+            print(f"File: {file_info.filename}")
+            print(f"Locations: {len(locations)}")
+            
+            journal_key = None if dry_run else self._journal_key([file_info.file_path])
+            if self._resume_from_journal(journal_key, [file_info.file_path], monitor_name, results):
+                return
+            
+            if dry_run:
+                print(f"[DRY RUN] Would create new monitor: {monitor_name} with {len(locations)} locations")
+                results['created'].append({
+                    'name': monitor_name, 
+                    'config_id': 'new',
+                    'file': str(file_info.file_path),
+                    'plan': self._plan_entry('create', None, monitor_name, [file_info], config)
+                })
+            else:
+                create_response = self.create_monitor(config)
+                if create_response:
+                    new_config_id = create_response.get('config_id', 'generated')
+                    print(f"✅ Successfully created new monitor with config_id: {new_config_id}")
+                    self.write_back_ids([file_info.file_path], create_response)
+                    self._journal_record(journal_key, 'created', new_config_id, monitor_name, [file_info.file_path])
+                    results['created'].append({
+                        'name': monitor_name,
+                        'config_id': new_config_id,
+                        'file': str(file_info.file_path),
+                        'response': create_response
+                    })
+                else:
+                    print(f"❌ Failed to create new monitor: {monitor_name}")
+                    results['failed'].append({
+                        'file': str(file_info.file_path),
+                        'error': 'Failed to create new monitor'
+                    })
+        
+        except Exception as e:
+            print(f"❌ Error creating new monitor from {file_info.filename}: {str(e)}")
+            results['failed'].append({
+                'file': str(file_info.file_path),
+                'error': str(e)
+            })
+
+    def monitor_config(self, monitor_data):
+        """Full config of a grouped monitor: its first file, with the locations of all its files merged"""
+        if 'config' not in monitor_data:
+            files = monitor_data['files']
+            config = files[0].config
+            if len(files) > 1:
+                # Merge locations (avoid duplicates)
+                merged_locations = LocationSet(config.get('locations', []))
+                for monitor_file in files[1:]:
+                    for location in monitor_file.config.get('locations', []):
+                        merged_locations.add(location)
+                config = dict(config, locations=merged_locations.to_list())
+            monitor_data['config'] = config
+        return monitor_data['config']
+
+    def _import_existing_monitor(self, item, results, dry_run=False, fresh_import=False, monitor_index=None):
+        """Create or update one monitor with all its merged locations (third pass)"""
+        config_id, monitor_data = item
+        monitor_name = monitor_data.get('name', 'Unknown')
+        try:
+            file_path = str(monitor_data['files'][0].file_path) if monitor_data['files'] else None
+            monitor_file_paths = [file_info.file_path for file_info in monitor_data['files']]
+            journal_key = None if dry_run else self._journal_key(monitor_file_paths)
+            if self._resume_from_journal(journal_key, monitor_file_paths, monitor_name, results, config_id):
+                return
+            
+            # Get existing monitor configuration (normal mode)
+            existing_monitor = None if fresh_import else self.find_existing_monitor(config_id, monitor_index)
+            
+            # Files untouched since they were written from the remote revision need not even be loaded
+            if (existing_monitor and self.skip_unchanged and not self.record_plan and self.manifest is not None
+                    and self.manifest.is_synced(self.space_id, config_id, existing_monitor.get('revision'))):
+                print(f"\n⏭️  No changes for {monitor_name} ({config_id}): files match revision "
+                      f"{existing_monitor.get('revision')}")
+                self._journal_record(journal_key, 'skipped', config_id, monitor_name, monitor_file_paths)
+                results['skipped'].append({
+                    'name': monitor_name,
+                    'config_id': config_id,
+                    'file': file_path,
+                    'reason': 'unchanged in Kibana'
+                })
+                return
+            
+            config = self.monitor_config(monitor_data)
+            monitor_name = config.get('name', 'Unknown')
+            new_locations = config.get('locations', [])
+            
+            print(f"\nProcessing monitor: {monitor_name} ({config_id})")
+            print(f"New locations to deploy: {len(new_locations)}")
+            
+            if fresh_import:
+                # Fresh import mode - skip existence check and create directly
+                if dry_run:
+                    print(f"[DRY RUN] Would create (fresh): {monitor_name} with {len(new_locations)} locations")
+                    results['created'].append({
+                        'name': monitor_name, 
+                        'config_id': config_id,
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'plan': self._plan_entry('create', config_id, monitor_name, monitor_data['files'], config)
+                    })
+                    return
+                
+                print(f"Fresh import - creating monitor without existence check...")
+                create_response = self.create_monitor(config)
+                
+                if create_response is not None:
+                    created_config_id = create_response.get('id') or create_response.get('config_id')
+                    print(f"Monitor created successfully with ID: {created_config_id}")
+                    self.write_back_ids(monitor_file_paths, create_response)
+                    self._journal_record(journal_key, 'created', created_config_id or config_id, monitor_name,
+                                         monitor_file_paths)
+                    
+                    results['created'].append({
+                        'name': monitor_name,
+                        'config_id': created_config_id or config_id,
+                        'total_locations': len(new_locations),
+                        'operation': 'fresh_create',
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'response': create_response
+                    })
+                    print(f"Successfully created monitor (fresh import)")
+                else:
+                    results['failed'].append({
+                        'name': monitor_name,
+                        'config_id': config_id,
+                        'operation': 'fresh_create',
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None
+                    })
+                return
+            
+            if dry_run:
+                if existing_monitor:
+                    existing_locations = existing_monitor.get('locations', [])
+                    merged_locations = self.merge_locations(existing_locations, new_locations)
+                    config_to_update = config.copy()
+                    config_to_update['locations'] = merged_locations
+                    if self.skip_unchanged and self.matches_remote(config_id, config_to_update, existing_monitor):
+                        print(f"[DRY RUN] No changes: {monitor_name} already matches Kibana")
+                        results['skipped'].append({
+                            'name': monitor_name,
+                            'config_id': config_id,
+                            'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                            'reason': 'unchanged in Kibana',
+                            'plan': self._plan_entry('noop', config_id, monitor_name, monitor_data['files'],
+                                                     config_to_update, existing_monitor)
+                        })
+                        return
+                    print(f"[DRY RUN] Would update: {monitor_name} with {len(merged_locations)} total locations")
+                    results['updated'].append({
+                        'name': monitor_name, 
+                        'config_id': config_id,
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'plan': self._plan_entry('update', config_id, monitor_name, monitor_data['files'],
+                                                 config_to_update, existing_monitor)
+                    })
+                else:
+                    print(f"[DRY RUN] Would create: {monitor_name} with {len(new_locations)} locations")
+                    results['created'].append({
+                        'name': monitor_name, 
+                        'config_id': config_id,
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'plan': self._plan_entry('create', config_id, monitor_name, monitor_data['files'], config,
+                                                 expect_absent=True)
+                    })
+                return
+            
+            # Perform actual create/update/restore workflow (normal mode)
+            if existing_monitor:
+                # Monitor exists - merge locations and update
+                print(f"Monitor exists, merging locations...")
+                existing_locations = existing_monitor.get('locations', [])
+                print(f"Existing locations: {len(existing_locations)}")
+                
+                # Merge existing and new locations
+                merged_locations = self.merge_locations(existing_locations, new_locations)
+                
+                # Update config with merged locations
+                config_to_update = config.copy()
+                config_to_update['locations'] = merged_locations
+                
+                # Every PUT bumps the revision and redeploys the monitor, so skip no-ops
+                if self.skip_unchanged and self.matches_remote(config_id, config_to_update, existing_monitor):
+                    print(f"⏭️  No changes for {monitor_name}, skipping update")
+                    self._journal_record(journal_key, 'skipped', config_id, monitor_name, monitor_file_paths)
+                    results['skipped'].append({
+                        'name': monitor_name,
+                        'config_id': config_id,
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'reason': 'unchanged in Kibana'
+                    })
+                    return
+                
+                print(f"Updating monitor with {len(merged_locations)} total locations")
+                response = self.update_monitor(config_id, config_to_update)
+                
+                if response is not None:
+                    self._journal_record(journal_key, 'updated', config_id, monitor_name, monitor_file_paths)
+                    results['updated'].append({
+                        'name': monitor_name,
+                        'config_id': config_id,
+                        'total_locations': len(merged_locations),
+                        'operation': 'location_merge_update',
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'response': response
+                    })
+                    print(f"Successfully updated monitor with merged locations")
+                else:
+                    results['failed'].append({
+                        'name': monitor_name,
+                        'config_id': config_id,
+                        'operation': 'update_after_merge',
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None
+                    })
+            else:
+                # Monitor doesn't exist - create workflow
+                print(f"Monitor doesn't exist, creating new monitor...")
+                
+                # Create the monitor
+                print(f"Creating monitor...")
+                create_response = self.create_monitor(config)
+                
+                if create_response is not None:
+                    created_config_id = create_response.get('id') or create_response.get('config_id')
+                    print(f"Monitor created successfully with ID: {created_config_id}")
+                    self.write_back_ids(monitor_file_paths, create_response)
+                    self._journal_record(journal_key, 'created', created_config_id or config_id, monitor_name,
+                                         monitor_file_paths)
+                    
+                    results['created'].append({
+                        'name': monitor_name,
+                        'config_id': created_config_id or config_id,
+                        'total_locations': len(new_locations),
+                        'operation': 'create',
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None,
+                        'response': create_response
+                    })
+                    print(f"Successfully created monitor")
+                else:
+                    results['failed'].append({
+                        'name': monitor_name,
+                        'config_id': config_id,
+                        'operation': 'create',
+                        'file': str(monitor_data['files'][0].file_path) if monitor_data['files'] else None
+                    })
+        
+        except Exception as e:
+            print(f"Error processing monitor {monitor_name}: {str(e)}")
+            results['failed'].append({
+                'name': monitor_name,
+                'config_id': config_id,
+                'error': str(e)
+            })
+
     def _process_space_monitors(self, monitor_files, dry_run=False, fresh_import=False):
         """Process monitors for a specific space"""
         try:
@@ -532,7 +1503,8 @@ class SyntheticsImporter:
                 'created': [],
                 'updated': [],
                 'failed': [],
-                'skipped': []
+                'skipped': [],
+                'other_shard': []  # Files left to other shards
             }
             
             # Process each monitor file
@@ -541,233 +1513,67 @@ class SyntheticsImporter:
             # Separate new monitors (no config_id) from existing monitors
             new_monitors = []  # Monitors without config_id
             
-            # First pass: collect all monitor configs and merge locations
-            for file_info in monitor_files:
+            # First pass: group files by config_id using only their identifying fields;
+            # full configs are loaded (and their locations merged) when a monitor is processed
+            for monitor_file in monitor_files:
                 try:
-                    config = self.load_monitor_config(file_info['file_path'])
-                    config_id = config.get('config_id')
-                    monitor_name = config.get('name', 'Unknown')
+                    config_id = monitor_file.config_id
+                    monitor_name = monitor_file.name
+                    
+                    # Every file of a monitor hashes to the same shard; new monitors are keyed by file path
+                    if self.shard and not self.shard.owns(config_id or monitor_file.file_path.as_posix()):
+                        results['other_shard'].append(str(monitor_file.file_path))
+                        continue
                     
                     if not config_id:
                         # No config_id = new monitor, treat separately
                         print(f"No config_id found for {monitor_name} - treating as new monitor")
-                        new_monitors.append({
-                            'config': config,
-                            'file_info': file_info
-                        })
+                        new_monitors.append({'file_info': monitor_file})
                         continue
                     
-                    # If we've seen this monitor before, merge the locations
+                    # If we've seen this monitor before, its locations are merged when it is processed
                     if config_id in processed_configs:
-                        existing_config = processed_configs[config_id]['config']
-                        current_locations = config.get('locations', [])
-                        existing_locations = existing_config.get('locations', [])
-                        
-                        # Merge locations (avoid duplicates)
-                        merged_locations = existing_locations.copy()
-                        for location in current_locations:
-                            if not any(loc.get('id') == location.get('id') for loc in merged_locations):
-                                merged_locations.append(location)
-                        
-                        existing_config['locations'] = merged_locations
-                        processed_configs[config_id]['files'].append(file_info)
-                        print(f"Merged locations for {monitor_name}: {len(merged_locations)} total locations")
+                        location_ids = processed_configs[config_id]['location_ids']
+                        location_ids.update(monitor_file.location_ids)
+                        processed_configs[config_id]['files'].append(monitor_file)
+                        print(f"Merged locations for {monitor_name}: {len(location_ids)} total locations")
                     else:
                         # First time seeing this monitor
                         processed_configs[config_id] = {
-                            'config': config,
-                            'files': [file_info]
+                            'name': monitor_name,
+                            'location_ids': set(monitor_file.location_ids),
+                            'files': [monitor_file]
                         }
-                        print(f"Processing {monitor_name} with {len(config.get('locations', []))} locations")
+                        print(f"Processing {monitor_name} with {len(monitor_file.location_ids)} locations")
                 
                 except Exception as e:
-                    print(f"Error loading {file_info['filename']}: {str(e)}")
+                    print(f"Error loading {monitor_file.filename}: {str(e)}")
                     results['failed'].append({
-                        'file': str(file_info['file_path']),
+                        'file': str(monitor_file.file_path),
                         'error': str(e)
                     })
             
-            # Second pass: process new monitors (no config_id)
-            print(f"\n=== Processing {len(new_monitors)} new monitors (no config_id) ===")
-            for new_monitor in new_monitors:
-                try:
-                    config = new_monitor['config']
-                    file_info = new_monitor['file_info']
-                    monitor_name = config.get('name', 'Unknown')
-                    locations = config.get('locations', [])
-                    
-                    print(f"\nCreating new monitor: {monitor_name}")
-                    print(f"File: {file_info['filename']}")
-                    print(f"Locations: {len(locations)}")
-                    
-                    if dry_run:
-                        print(f"[DRY RUN] Would create new monitor: {monitor_name} with {len(locations)} locations")
-                        results['created'].append({
-                            'name': monitor_name, 
-                            'config_id': 'new',
-                            'file': str(file_info['file_path'])
-                        })
-                    else:
-                        create_response = self.create_monitor(config)
-                        if create_response:
-                            new_config_id = create_response.get('config_id', 'generated')
-                            print(f"✅ Successfully created new monitor with config_id: {new_config_id}")
-                            results['created'].append({
-                                'name': monitor_name,
-                                'config_id': new_config_id,
-                                'file': str(file_info['file_path'])
-                            })
-                        else:
-                            print(f"❌ Failed to create new monitor: {monitor_name}")
-                            results['failed'].append({
-                                'file': str(file_info['file_path']),
-                                'error': 'Failed to create new monitor'
-                            })
-                
-                except Exception as e:
-                    print(f"❌ Error creating new monitor from {file_info['filename']}: {str(e)}")
-                    results['failed'].append({
-                        'file': str(file_info['file_path']),
-                        'error': str(e)
-                    })
+            # One paged listing of the space replaces a GET per monitor for the create/update decision
+            monitor_index = None
+            if processed_configs and not fresh_import:
+                monitor_index = self.build_monitor_index(len(processed_configs))
             
-            # Third pass: process each unique monitor with all its locations (existing monitors)
-            print(f"\n=== Processing {len(processed_configs)} existing monitors (with config_id) ===")
-            for config_id, monitor_data in processed_configs.items():
-                try:
-                    config = monitor_data['config']
-                    monitor_name = config.get('name', 'Unknown')
-                    new_locations = config.get('locations', [])
-                    
-                    print(f"\nProcessing monitor: {monitor_name} ({config_id})")
-                    print(f"New locations to deploy: {len(new_locations)}")
-                    
-                    if fresh_import:
-                        # Fresh import mode - skip existence check and create directly
-                        if dry_run:
-                            print(f"[DRY RUN] Would create (fresh): {monitor_name} with {len(new_locations)} locations")
-                            results['created'].append({
-                                'name': monitor_name, 
-                                'config_id': config_id,
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                            continue
-                        
-                        print(f"Fresh import - creating monitor without existence check...")
-                        create_response = self.create_monitor(config)
-                        
-                        if create_response is not None:
-                            created_config_id = create_response.get('id') or create_response.get('config_id')
-                            print(f"Monitor created successfully with ID: {created_config_id}")
-                            
-                            results['created'].append({
-                                'name': monitor_name,
-                                'config_id': created_config_id or config_id,
-                                'total_locations': len(new_locations),
-                                'operation': 'fresh_create',
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                            print(f"Successfully created monitor (fresh import)")
-                        else:
-                            results['failed'].append({
-                                'name': monitor_name,
-                                'config_id': config_id,
-                                'operation': 'fresh_create',
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                        continue
-                    
-                    # Get existing monitor configuration (normal mode)
-                    existing_monitor = self.get_existing_monitor(config_id)
-                    
-                    if dry_run:
-                        if existing_monitor:
-                            existing_locations = existing_monitor.get('locations', [])
-                            merged_locations = self.merge_locations(existing_locations, new_locations)
-                            print(f"[DRY RUN] Would update: {monitor_name} with {len(merged_locations)} total locations")
-                            results['updated'].append({
-                                'name': monitor_name, 
-                                'config_id': config_id,
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                        else:
-                            print(f"[DRY RUN] Would create: {monitor_name} with {len(new_locations)} locations")
-                            results['created'].append({
-                                'name': monitor_name, 
-                                'config_id': config_id,
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                        continue
-                    
-                    # Perform actual create/update/restore workflow (normal mode)
-                    if existing_monitor:
-                        # Monitor exists - merge locations and update
-                        print(f"Monitor exists, merging locations...")
-                        existing_locations = existing_monitor.get('locations', [])
-                        print(f"Existing locations: {len(existing_locations)}")
-                        
-                        # Merge existing and new locations
-                        merged_locations = self.merge_locations(existing_locations, new_locations)
-                        
-                        # Update config with merged locations
-                        config_to_update = config.copy()
-                        config_to_update['locations'] = merged_locations
-                        
-                        print(f"Updating monitor with {len(merged_locations)} total locations")
-                        response = self.update_monitor(config_id, config_to_update)
-                        
-                        if response is not None:
-                            results['updated'].append({
-                                'name': monitor_name,
-                                'config_id': config_id,
-                                'total_locations': len(merged_locations),
-                                'operation': 'location_merge_update',
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                            print(f"Successfully updated monitor with merged locations")
-                        else:
-                            results['failed'].append({
-                                'name': monitor_name,
-                                'config_id': config_id,
-                                'operation': 'update_after_merge',
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                    else:
-                        # Monitor doesn't exist - create workflow
-                        print(f"Monitor doesn't exist, creating new monitor...")
-                        
-                        # Create the monitor
-                        print(f"Creating monitor...")
-                        create_response = self.create_monitor(config)
-                        
-                        if create_response is not None:
-                            created_config_id = create_response.get('id') or create_response.get('config_id')
-                            print(f"Monitor created successfully with ID: {created_config_id}")
-                            
-                            results['created'].append({
-                                'name': monitor_name,
-                                'config_id': created_config_id or config_id,
-                                'total_locations': len(new_locations),
-                                'operation': 'create',
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                            print(f"Successfully created monitor")
-                        else:
-                            results['failed'].append({
-                                'name': monitor_name,
-                                'config_id': config_id,
-                                'operation': 'create',
-                                'file': str(monitor_data['files'][0]['file_path']) if monitor_data['files'] else None
-                            })
-                
-                except Exception as e:
-                    print(f"Error processing monitor {monitor_name}: {str(e)}")
-                    results['failed'].append({
-                        'name': monitor_name,
-                        'config_id': config_id,
-                        'error': str(e)
-                    })
+            # Optional bulk mode; whatever it cannot push goes through the per-monitor passes below
+            pending_new_monitors = new_monitors
+            pending_configs = processed_configs
+            if self.bulk_project:
+                pending_new_monitors, pending_configs = self._import_bulk(
+                    new_monitors, processed_configs, results, dry_run, fresh_import, monitor_index)
             
+            # Second pass: process new monitors (no config_id)
+            print(f"\n=== Processing {len(pending_new_monitors)} new monitors (no config_id) ===")
+            self._run_operations(self._import_new_monitor, pending_new_monitors, results, dry_run=dry_run)
+
+            # Third pass: process each unique monitor with all its locations (existing monitors)
+            print(f"\n=== Processing {len(pending_configs)} existing monitors (with config_id) ===")
+            self._run_operations(self._import_existing_monitor, list(pending_configs.items()), results,
+                                 dry_run=dry_run, fresh_import=fresh_import, monitor_index=monitor_index)
+
             # Print summary
             mode_text = ""
             if dry_run:
@@ -784,6 +1590,8 @@ class SyntheticsImporter:
             print(f"Updated: {len(results['updated'])}")
             print(f"Failed: {len(results['failed'])}")
             print(f"Skipped: {len(results['skipped'])}")
+            if self.shard:
+                print(f"Left to other shards (shard {self.shard}): {len(results['other_shard'])} files")
             
             if results['created']:
                 print(f"\nCreated monitors:")
@@ -817,7 +1625,8 @@ class SyntheticsImporter:
                 'created': [],
                 'updated': [],
                 'failed': [{'error': str(e)}],
-                'skipped': []
+                'skipped': [],
+                'other_shard': []
             }
     
     def _print_overall_summary(self, all_results, dry_run=False, fresh_import=False):
@@ -842,6 +1651,9 @@ class SyntheticsImporter:
         print(f"Total updated: {total_updated}")
         print(f"Total failed: {total_failed}")
         print(f"Total skipped: {total_skipped}")
+        if self.shard:
+            total_other_shard = sum(len(results.get('other_shard', [])) for results in all_results.values())
+            print(f"Files left to other shards (shard {self.shard}): {total_other_shard}")
         
         for space_id, results in all_results.items():
             print(f"\nSpace '{space_id}':")
@@ -849,6 +1661,17 @@ class SyntheticsImporter:
             print(f"  Updated: {len(results.get('updated', []))}")
             print(f"  Failed: {len(results.get('failed', []))}")
             print(f"  Skipped: {len(results.get('skipped', []))}")
+    
+    def save_summary(self, all_results, summary_path):
+        """Write this run's counts and failures for merge-shard-summaries.py"""
+        buckets = ('created', 'updated', 'failed', 'skipped', 'other_shard')
+        spaces = {space_id: {bucket: len(results.get(bucket, [])) for bucket in buckets}
+                  for space_id, results in (all_results or {}).items()}
+        counts = {bucket: sum(space_counts[bucket] for space_counts in spaces.values()) for bucket in buckets}
+        failed = [f"{space_id}: {item.get('name', item.get('file', 'Unknown'))} - {item.get('error', 'Unknown error')}"
+                  for space_id, results in (all_results or {}).items() for item in results.get('failed', [])]
+        write_summary(summary_path, 'import', self.shard, counts, failed, spaces)
+        print(f"Wrote run summary to {summary_path}")
 
 def main():
     """Main execution function"""
@@ -860,6 +1683,18 @@ def main():
                        help='Only process changed files from CHANGED_FILES environment variable')
     parser.add_argument('--fresh-import', action='store_true',
                        help='Fresh import mode - import all monitors without checking existence')
+    parser.add_argument('--force-update', action='store_true',
+                       help='Update existing monitors even when they already match Kibana')
+    parser.add_argument('--resume', action='store_true',
+                       help='Skip monitors an interrupted run already imported (from the import journal)')
+    parser.add_argument('--plan-out', metavar='PATH',
+                       help='Dry run that writes the create/update/no-op decisions to an import plan file')
+    parser.add_argument('--apply-plan', metavar='PATH',
+                       help='Apply a plan written by --plan-out instead of reading monitor files')
+    parser.add_argument('--shard', metavar='I/N', type=Shard.parse,
+                       help='Only import the monitors of shard I of N (0-based), for a CI matrix')
+    parser.add_argument('--summary-out', metavar='PATH',
+                       help='Write the run counts and failures as JSON, for merge-shard-summaries.py')
     args = parser.parse_args()
     
     kibana_url = os.getenv('KIBANA_URL')
@@ -867,6 +1702,12 @@ def main():
     space_id = os.getenv('KIBANA_SPACE_ID', 'default')
     dry_run = os.getenv('DRY_RUN', 'false').lower() in ['true', '1', 'yes']
     changed_files = os.getenv('CHANGED_FILES', '').strip() if args.changed_files else None
+    parallel_spaces = int(os.getenv('KIBANA_PARALLEL_SPACES', '4'))
+    max_workers = int(os.getenv('IMPORT_CONCURRENCY', '8'))
+    page_size = int(os.getenv('IMPORT_PAGE_SIZE', '100'))
+    bulk_project = os.getenv('IMPORT_BULK_PROJECT', '').strip() or None
+    bulk_chunk_size = int(os.getenv('IMPORT_BULK_CHUNK_SIZE', '100'))
+    journal_path = os.getenv('IMPORT_JOURNAL', DEFAULT_JOURNAL_PATH)
     
     if not all([kibana_url, api_key]):
         print("Missing required environment variables:")
@@ -877,15 +1718,42 @@ def main():
         print("- DRY_RUN: Set to 'true' for dry run mode")
         sys.exit(1)
     
+    if args.plan_out and args.apply_plan:
+        print("--plan-out and --apply-plan cannot be used together")
+        sys.exit(1)
+    if bulk_project and (args.plan_out or args.apply_plan):
+        print("Import plans cover the per-monitor API only; unset IMPORT_BULK_PROJECT to plan or apply")
+        sys.exit(1)
+    if args.plan_out:
+        dry_run = True  # Planning never writes to Kibana
+    if args.shard and args.apply_plan:
+        print("A plan already covers only the shard it was made for; drop --shard when applying it")
+        sys.exit(1)
+    if args.shard and journal_path == DEFAULT_JOURNAL_PATH:
+        journal_path = journal_path.replace('.jsonl', f"{args.shard.suffix}.jsonl")
+    if args.resume and (dry_run or args.apply_plan or bulk_project):
+        print("--resume applies to live per-monitor imports only")
+        sys.exit(1)
+    
     print(f"Kibana Synthetics Monitor Import")
-    if args.fresh_import:
+    if args.apply_plan:
+        print(f"APPLY PLAN MODE - Executing {args.apply_plan}")
+    elif args.fresh_import:
         print("FRESH IMPORT MODE - Importing all monitors without existence check")
+    elif args.plan_out:
+        print(f"PLAN MODE - Writing import plan to {args.plan_out}")
     elif dry_run:
         print("DRY RUN MODE")
     else:
         print("LIVE MODE")
     if args.changed_files:
         print("CHANGED FILES MODE - Processing only modified monitors")
+    if args.resume:
+        print(f"RESUME MODE - Skipping operations recorded in {journal_path}")
+    if bulk_project:
+        print(f"BULK MODE - Pushing eligible monitors through project '{bulk_project}'")
+    if args.shard:
+        print(f"SHARD MODE - Importing shard {args.shard} of the monitors")
     print("=" * 50)
     print(f"Kibana URL: {kibana_url}")
     print(f"Space ID: {space_id}")
@@ -893,8 +1761,34 @@ def main():
         print(f"Changed files: {changed_files}")
     print()
     
-    importer = SyntheticsImporter(kibana_url, api_key, space_id)
-    importer.import_monitors(dry_run=dry_run, changed_files_filter=changed_files, fresh_import=args.fresh_import)
+    importer = SyntheticsImporter(kibana_url, api_key, space_id, parallel_spaces=parallel_spaces,
+                                  max_workers=max_workers, page_size=page_size,
+                                  skip_unchanged=not args.force_update,
+                                  bulk_project=bulk_project, bulk_chunk_size=bulk_chunk_size,
+                                  record_plan=bool(args.plan_out), shard=args.shard,
+                                  client=KibanaClient.from_env(kibana_url, api_key))
+    
+    if args.apply_plan:
+        try:
+            plan = ImportPlan.load(args.apply_plan)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load import plan {args.apply_plan}: {str(e)}")
+            sys.exit(1)
+        all_results = importer.apply_plan(plan)
+        if args.summary_out:
+            importer.save_summary(all_results, args.summary_out)
+        return
+    
+    # Live per-monitor imports journal every completed operation so an interrupted run can be resumed
+    if not dry_run and not bulk_project:
+        importer.journal = ImportJournal(journal_path, resume=args.resume)
+        if args.resume:
+            print(f"Loaded {len(importer.journal)} completed operations from {journal_path}")
+    
+    all_results = importer.import_monitors(dry_run=dry_run, changed_files_filter=changed_files,
+                                           fresh_import=args.fresh_import, plan_path=args.plan_out)
+    if args.summary_out:
+        importer.save_summary(all_results, args.summary_out)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Append-only journal of completed import operations, used to resume interrupted imports"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_JOURNAL_PATH = '.synthetics-state/import-journal.jsonl'
+
+
+def hash_files(file_paths):
+    """sha256 over the contents of a monitor's source files (path order does not matter)"""
+    digest = hashlib.sha256()
+    for file_path in sorted(str(path) for path in file_paths):
+        digest.update(file_path.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(Path(file_path).read_bytes())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ImportJournal:
+    """One JSON line per completed create/update/no-op, keyed by space and source file paths
+
+    The key does not depend on file contents, because a create writes the
+    new config_id back into its files (and the export rewrites or renames
+    them); each entry records the hash of the files once the operation
+    finished instead, and creates can also be looked up by the config_id
+    they produced. A new run truncates the journal; a resumed run loads it and keeps
+    appending. Each line is flushed and fsynced before the next operation
+    is reported, so a run killed at any point leaves every finished
+    operation on disk (a torn last line is ignored on load).
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH, resume=False):
+        self.path = Path(path)
+        self.completed = {}
+        self.created = {}  # (space_id, config_id) -> entry of the create that produced it
+        self.lock = threading.Lock()
+
+        if self.path.parent != Path('.'):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if resume and self.path.exists():
+            self._load()
+            self.file = open(self.path, 'a', encoding='utf-8')
+        else:
+            self.file = open(self.path, 'w', encoding='utf-8')
+
+    @staticmethod
+    def key(space_id, file_paths):
+        """Journal key for a monitor: its space and its source files (order does not matter)"""
+        return f"{space_id}:{'|'.join(sorted(Path(file_path).as_posix() for file_path in file_paths))}"
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write from the interrupted run
+                self._add(entry)
+
+    def _add(self, entry):
+        self.completed[entry['key']] = entry
+        if entry['bucket'] == 'created' and entry.get('config_id'):
+            self.created[(entry['key'].split(':', 1)[0], entry['config_id'])] = entry
+
+    def get(self, key):
+        """Return the journal entry for key, or None if that operation has not completed"""
+        return self.completed.get(key)
+
+    def record(self, key, bucket, config_id, name, files_hash=None):
+        """Append a completed operation (bucket is created, updated or skipped) and sync it to disk"""
+        entry = {
+            'key': key,
+            'bucket': bucket,
+            'config_id': config_id,
+            'name': name,
+            'files_hash': files_hash,
+            'completed_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        }
+        line = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+        with self.lock:
+            self.file.write(line + '\n')
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self._add(entry)
+
+    def get_created(self, space_id, config_id):
+        """Return the entry of the create that produced config_id in space_id, or None"""
+        return self.created.get((space_id, config_id))
+
+    def __len__(self):
+        return len(self.completed)
+
+    def close(self):
+        self.file.close()
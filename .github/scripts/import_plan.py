@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Serialized import plans: the create/update/no-op decisions of a dry run, applied later as-is"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+PLAN_VERSION = 2
+PLAN_ACTIONS = ('create', 'update', 'noop')
+
+
+def payload_hash(payload):
+    """Stable sha256 of a request payload (key order and whitespace do not matter)"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ImportPlan:
+    """Planned monitor operations for one Kibana instance, grouped by space
+
+    Each entry records the action, the exact payload to send with its hash,
+    and the remote revision the decision was based on; creates also record
+    the hash of their source files. Applying the plan checks those first, so
+    a plan made against a Kibana that has since changed, or one that was
+    already applied (its creates wrote config_ids into their files), is
+    refused instead of overwriting newer edits or creating monitors twice.
+    """
+
+    def __init__(self, kibana_url, entries=None, fresh_import=False, created_at=None):
+        self.kibana_url = kibana_url.rstrip('/')
+        self.entries = list(entries or [])
+        self.fresh_import = fresh_import
+        self.created_at = created_at or datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    @staticmethod
+    def make_entry(action, config_id, name, files, payload, remote_revision=None, expect_absent=False,
+                   files_hash=None):
+        """Build one plan entry; space_id is filled in when the entry is added to a plan"""
+        if action not in PLAN_ACTIONS:
+            raise ValueError(f"Unknown plan action: {action}")
+        return {
+            'action': action,
+            'config_id': config_id,
+            'name': name,
+            'files': [str(file_path) for file_path in files],
+            'payload': payload,
+            'payload_hash': payload_hash(payload),
+            'remote_revision': remote_revision,
+            'expect_absent': expect_absent,
+            'files_hash': files_hash
+        }
+
+    def add(self, space_id, entry):
+        """Add an entry for space_id"""
+        self.entries.append(dict(entry, space_id=space_id))
+
+    def entries_by_space(self):
+        """Return {space_id: [entries]} in plan order"""
+        by_space = {}
+        for entry in self.entries:
+            by_space.setdefault(entry['space_id'], []).append(entry)
+        return by_space
+
+    def counts(self):
+        """Return {action: count}"""
+        counts = {action: 0 for action in PLAN_ACTIONS}
+        for entry in self.entries:
+            counts[entry['action']] += 1
+        return counts
+
+    def to_dict(self):
+        return {
+            'version': PLAN_VERSION,
+            'kibana_url': self.kibana_url,
+            'created_at': self.created_at,
+            'fresh_import': self.fresh_import,
+            'entries': self.entries
+        }
+
+    def save(self, path):
+        """Write the plan as JSON"""
+        path = Path(path)
+        if path.parent != Path('.'):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        """Read a plan, rejecting unknown versions and entries whose payload no longer matches its hash"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != PLAN_VERSION:
+            raise ValueError(f"Unsupported plan version {data.get('version')} (expected {PLAN_VERSION})")
+
+        entries = data.get('entries', [])
+        for entry in entries:
+            if entry.get('action') not in PLAN_ACTIONS:
+                raise ValueError(f"Unknown plan action for {entry.get('name')}: {entry.get('action')}")
+            if payload_hash(entry.get('payload')) != entry.get('payload_hash'):
+                raise ValueError(f"Payload of {entry.get('name')} does not match its hash; the plan was modified")
+
+        return cls(data['kibana_url'], entries, fresh_import=data.get('fresh_import', False),
+                   created_at=data.get('created_at'))
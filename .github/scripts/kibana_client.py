@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Shared Kibana HTTP client: pooled keep-alive connections, timeouts and retries"""
+
+import json
+import os
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import AdaptiveLimiter
+
+
+class KibanaRequestError(Exception):
+    """Raised when a Kibana API request fails (after any retries)"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class KibanaClient:
+    """HTTP client for the Kibana APIs used by the export, import and agent-update scripts
+
+    One client is shared by everything in a process. Reads (GET) and writes
+    (POST/PUT/DELETE) go through separate adaptive limiters whose concurrency
+    follows observed 429s and latency, the connection pool is sized to both
+    budgets, and 429/5xx responses are retried with jittered exponential
+    backoff that honors Retry-After.
+    """
+
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+    CONGESTION_STATUSES = frozenset([429, 503])
+
+    def __init__(self, kibana_url, api_key, max_concurrency=16, max_write_concurrency=None, adaptive=True,
+                 timeout=60, connect_timeout=10, max_retries=5, backoff_base=1.0, backoff_max=60.0):
+        self.kibana_url = kibana_url.rstrip('/')  # Remove trailing slash
+        self.max_concurrency = max(1, int(max_concurrency))
+        # Writes redeploy monitors through Kibana's task manager, so they get a smaller budget
+        self.max_write_concurrency = max(1, int(max_write_concurrency or self.max_concurrency // 2))
+        self.timeout = (connect_timeout, timeout)
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'ApiKey {api_key}',
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip',
+            'kbn-xsrf': 'true'
+        })
+        # Keep-alive pool sized to both budgets so parallel workers never open throwaway connections
+        pool_size = self.max_concurrency + self.max_write_concurrency
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Separate read and write budgets shared by every thread using this client
+        self.read_limiter = AdaptiveLimiter('read', self.max_concurrency, adaptive=adaptive)
+        self.write_limiter = AdaptiveLimiter('write', self.max_write_concurrency, adaptive=adaptive)
+
+    @classmethod
+    def from_env(cls, kibana_url, api_key):
+        """Build a client from the KIBANA_* concurrency, timeout and retry environment variables"""
+        max_write_concurrency = os.getenv('KIBANA_MAX_WRITE_CONCURRENCY')
+        return cls(
+            kibana_url,
+            api_key,
+            max_concurrency=int(os.getenv('KIBANA_MAX_CONCURRENCY', '16')),
+            max_write_concurrency=int(max_write_concurrency) if max_write_concurrency else None,
+            adaptive=os.getenv('KIBANA_ADAPTIVE_CONCURRENCY', 'true').lower() in ['true', '1', 'yes'],
+            timeout=float(os.getenv('KIBANA_TIMEOUT', '60')),
+            connect_timeout=float(os.getenv('KIBANA_CONNECT_TIMEOUT', '10')),
+            max_retries=int(os.getenv('KIBANA_MAX_RETRIES', '5'))
+        )
+
+    def _is_retryable(self, method, status_code=None, error=None):
+        """Decide whether a failed attempt may be retried without risking a duplicate write"""
+        if method == 'POST':
+            # A POST may already have been applied; only retry when Kibana never processed it
+            return status_code == 429 or isinstance(error, requests.exceptions.ConnectTimeout)
+        if error is not None:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return status_code in self.RETRY_STATUSES
+
+    def _retry_after(self, response):
+        """Parse a Retry-After header (seconds or HTTP date) into a delay in seconds"""
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _backoff_delay(self, attempt, response=None):
+        """Delay before the next attempt: Retry-After if given, else full-jitter exponential backoff"""
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max) + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _send(self, method, url, data):
+        """Send one attempt through the read or write budget, feeding the outcome back to it"""
+        limiter = self.read_limiter if method in ('GET', 'HEAD') else self.write_limiter
+        limiter.acquire()
+        started = time.monotonic()
+        outcome = {'observed': False}  # Any other exception frees the slot without feeding the limit
+        try:
+            response = self.session.request(method, url, json=data, timeout=self.timeout)
+            outcome = {'latency': time.monotonic() - started,
+                       'congested': response.status_code in self.CONGESTION_STATUSES}
+            return response
+        except requests.exceptions.RequestException as e:
+            outcome = {'congested': isinstance(e, requests.exceptions.Timeout)}
+            raise
+        finally:
+            limiter.release(**outcome)
+
+    def request(self, method, endpoint, data=None):
+        """Send a request and return the requests.Response, retrying transient failures"""
+        method = method.upper()
+        url = f"{self.kibana_url}{endpoint}"
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._send(method, url, data)
+            except requests.exceptions.RequestException as e:
+                if attempt < self.max_retries and self._is_retryable(method, error=e):
+                    delay = self._backoff_delay(attempt)
+                    print(f"⚠️  {method} {endpoint} failed ({e.__class__.__name__}), "
+                          f"retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+                    time.sleep(delay)
+                    continue
+                raise KibanaRequestError(f"Request failed: {str(e)}")
+
+            if (response.status_code in self.RETRY_STATUSES and attempt < self.max_retries
+                    and self._is_retryable(method, status_code=response.status_code)):
+                delay = self._backoff_delay(attempt, response)
+                print(f"⚠️  {method} {endpoint} returned {response.status_code}, "
+                      f"retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+                continue
+
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                raise KibanaRequestError(f"Request failed: {str(e)}", response.status_code)
+            return response
+
+    def request_json(self, method, endpoint, data=None):
+        """Send a request and decode the JSON body ({} for empty responses)"""
+        response = self.request(method, endpoint, data)
+
+        # Handle empty responses
+        if response.status_code == 204 or not response.content:
+            return {}
+
+        try:
+            return response.json()
+        except json.JSONDecodeError as e:
+            raise KibanaRequestError(f"Failed to parse JSON response: {str(e)}", response.status_code)
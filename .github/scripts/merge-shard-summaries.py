@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Merge the --summary-out files of a sharded import or export into one report
+Exits non-zero if any shard failed, is missing, or ran twice
+"""
+
+import argparse
+import json
+import sys
+
+from sharding import merge_summaries
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Merge per-shard import/export summaries')
+    parser.add_argument('summaries', nargs='+', metavar='SUMMARY',
+                       help='Summary files written with --summary-out, one per shard')
+    parser.add_argument('--output', metavar='PATH',
+                       help='Also write the merged summary as JSON')
+    args = parser.parse_args()
+
+    summaries = []
+    for summary_path in args.summaries:
+        try:
+            with open(summary_path, 'r', encoding='utf-8') as f:
+                summaries.append(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Could not read summary {summary_path}: {str(e)}")
+            sys.exit(1)
+
+    merged = merge_summaries(summaries)
+
+    print(f"Merged {len(summaries)} shard summaries ({', '.join(merged['scripts'])})")
+    print("=" * 50)
+    for name, value in sorted(merged['counts'].items()):
+        print(f"{name}: {value}")
+
+    for space_id, counts in sorted(merged['spaces'].items()):
+        print(f"\nSpace '{space_id}':")
+        for name, value in sorted(counts.items()):
+            print(f"  {name}: {value}")
+
+    if merged['failed']:
+        print(f"\nFailures ({len(merged['failed'])}):")
+        for failure in merged['failed']:
+            print(f"   - {failure}")
+
+    if merged['problems']:
+        print("\nIncomplete shard set:")
+        for problem in merged['problems']:
+            print(f"   - {problem}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    if merged['failed'] or merged['problems']:
+        sys.exit(1)
+    print("\n✅ All shards completed")
+
+if __name__ == "__main__":
+    main()
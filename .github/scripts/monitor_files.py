@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Shared helpers for monitor files under monitors/{space_id}/{location}/"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from monitor_schema import validate_monitor_schema
+
+# Top-level fields Kibana rewrites on every save without any semantic change
+DEFAULT_VOLATILE_FIELDS = ('updated_at', 'created_at', 'revision', '__ui')
+
+
+def write_atomic(file_path, content):
+    """Write bytes to file_path through a synced temp file and a rename
+
+    Readers (and a run killed mid-write) see either the old file or the new
+    one, never a truncated mix.
+    """
+    file_path = Path(file_path)
+    try:
+        mode = file_path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644  # mkstemp creates 0600 files; keep new monitor files readable like before
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(file_path, content):
+    """Write bytes to file_path only when they differ from the existing file
+
+    Returns True if the file was written, False if it already held the same
+    bytes (its mtime is left untouched so git does not need to rehash it).
+    """
+    file_path = Path(file_path)
+    try:
+        # Cheap size check first; only read the file back when sizes match
+        if file_path.stat().st_size == len(content) and file_path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+
+    write_atomic(file_path, content)
+    return True
+
+
+def read_monitor_config(file_path):
+    """Load a monitor config from a JSON file"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        raise Exception(f"Failed to load monitor config from {file_path}: {str(e)}")
+
+
+def check_monitor_config(config):
+    """Return the problems in a monitor config that the importer (or Kibana) would fail on
+
+    Checks the fields the import depends on: a name, a type, locations with
+    ids, and an agentPolicyId for private (not service-managed) locations,
+    then the schema of the monitor's type (see monitor_schema).
+    """
+    if not isinstance(config, dict):
+        return ["top level must be a JSON object"]
+    
+    errors = []
+    for field in ('name', 'type'):
+        if not isinstance(config.get(field), str) or not config[field].strip():
+            errors.append(f"'{field}' must be a non-empty string")
+    
+    if isinstance(config.get('type'), str) and config['type'].strip():
+        errors.extend(validate_monitor_schema(config))
+    
+    locations = config.get('locations')
+    if not isinstance(locations, list) or not locations:
+        errors.append("'locations' must be a non-empty list")
+        return errors
+    
+    for index, location in enumerate(locations):
+        if not isinstance(location, dict):
+            errors.append(f"locations[{index}] must be an object")
+            continue
+        if not location.get('id'):
+            errors.append(f"locations[{index}] has no 'id'")
+        if (location.get('isServiceManaged') is False and not location.get('agentPolicyId')
+                and not config.get('agentPolicyId')):
+            errors.append(f"locations[{index}] ({location.get('id', 'no id')}) is a private location "
+                          f"without 'agentPolicyId'")
+    return errors
+
+
+def validate_monitor_file(file_path):
+    """Load and check one monitor file; returns (file_path, errors)
+
+    Module level (not a method) so a ProcessPoolExecutor can pickle it.
+    """
+    try:
+        config = read_monitor_config(file_path)
+    except Exception as e:
+        cause = e.__context__ or e  # The JSON error, with line and column
+        return str(file_path), [f"invalid JSON: {str(cause)}"]
+    return str(file_path), check_monitor_config(config)
+
+
+class MonitorSerializer:
+    """Serialize monitor configs for monitors/{space_id}/{location}/ files
+
+    In canonical mode keys are sorted and volatile fields are dropped, so an
+    export of an unchanged monitor produces byte-identical files.
+    """
+
+    def __init__(self, canonical=True, volatile_fields=DEFAULT_VOLATILE_FIELDS):
+        self.canonical = canonical
+        self.volatile_fields = frozenset(volatile_fields)
+
+    @classmethod
+    def from_env(cls):
+        """Build a serializer from MONITOR_CANONICAL_JSON and MONITOR_VOLATILE_FIELDS"""
+        canonical = os.getenv('MONITOR_CANONICAL_JSON', 'true').lower() in ['true', '1', 'yes']
+        volatile_env = os.getenv('MONITOR_VOLATILE_FIELDS')
+        if volatile_env is None:
+            volatile_fields = DEFAULT_VOLATILE_FIELDS
+        else:
+            volatile_fields = [field.strip() for field in volatile_env.split(',') if field.strip()]
+        return cls(canonical=canonical, volatile_fields=volatile_fields)
+
+    def canonicalize(self, config):
+        """Return a copy of config without volatile top-level fields"""
+        return {key: value for key, value in config.items() if key not in self.volatile_fields}
+
+    def serialize(self, config):
+        """Serialize a monitor config to the exact bytes written to disk"""
+        if self.canonical:
+            return json.dumps(self.canonicalize(config), indent=2, sort_keys=True,
+                              ensure_ascii=False).encode('utf-8')
+        return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def write(self, file_path, config):
+        """Serialize a monitor config in memory and write it only if the content changed"""
+        return write_if_changed(file_path, self.serialize(config))
+
+
+class LocationSet:
+    """Monitor locations keyed by location id, in insertion order, with O(1) membership
+
+    The first location seen for an id wins, matching the merge rules used when
+    several location files (or Kibana) describe the same monitor.
+    """
+
+    def __init__(self, locations=()):
+        self._by_id = {}
+        for location in locations:
+            self.add(location)
+
+    def add(self, location):
+        """Add a location unless its id is already present; returns True if it was added"""
+        location_id = location.get('id')
+        if location_id in self._by_id:
+            return False
+        self._by_id[location_id] = location
+        return True
+
+    def __contains__(self, location):
+        location_id = location.get('id') if isinstance(location, dict) else location
+        return location_id in self._by_id
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def to_list(self):
+        """Return the locations as a list in insertion order"""
+        return list(self._by_id.values())
+
+
+class MonitorFile:
+    """A monitors/{space_id}/{location}/{file}.json file, parsed only when needed
+
+    The identifying fields (config_id, name, location ids) come from a
+    header, normally the file's monitor manifest entry, so an unchanged file
+    is never parsed just to be grouped or skipped. The full config is parsed
+    on first access and cached.
+    """
+
+    __slots__ = ('file_path', 'space_id', 'location_folder', 'filename', 'header', '_config')
+
+    def __init__(self, file_path, space_id, location_folder, header=None, config=None):
+        self.file_path = Path(file_path)
+        self.space_id = space_id
+        self.location_folder = location_folder
+        self.filename = self.file_path.name
+        self.header = header  # Dict with config_id, name and locations (ids); None until known
+        self._config = config
+
+    @property
+    def config(self):
+        """The full monitor config (parsed on first access)"""
+        if self._config is None:
+            self._config = read_monitor_config(self.file_path)
+        return self._config
+
+    @config.setter
+    def config(self, config):
+        self._config = config
+
+    def _header_field(self, key):
+        if self.header is None:
+            config = self.config
+            self.header = {
+                'config_id': config.get('config_id'),
+                'name': config.get('name'),
+                'locations': [location.get('id') for location in config.get('locations', [])
+                              if isinstance(location, dict)]
+            }
+        return self.header.get(key)
+
+    @property
+    def config_id(self):
+        return self._header_field('config_id')
+
+    @property
+    def name(self):
+        return self._header_field('name') or 'Unknown'
+
+    @property
+    def location_ids(self):
+        return self._header_field('locations') or []
+
+
+def scan_monitor_files(monitors_dir):
+    """List monitors/{space_id}/{location}/*.json with os.scandir (no per-file stat or parse)"""
+    monitor_files = []
+    with os.scandir(monitors_dir) as space_entries:
+        for space_entry in sorted(space_entries, key=lambda entry: entry.name):
+            if not space_entry.is_dir():
+                continue
+            with os.scandir(space_entry.path) as location_entries:
+                for location_entry in sorted(location_entries, key=lambda entry: entry.name):
+                    if not location_entry.is_dir():
+                        continue
+                    with os.scandir(location_entry.path) as file_entries:
+                        for file_entry in sorted(file_entries, key=lambda entry: entry.name):
+                            if file_entry.name.endswith('.json') and file_entry.is_file():
+                                monitor_files.append(MonitorFile(Path(file_entry.path), space_entry.name,
+                                                                 location_entry.name))
+    return monitor_files
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Generated manifest of monitor files (monitors/index.json)
+Maps each space/location file to its config_id, locations, content hash, last synced
+revision and agentPolicyId, so tools can look monitors up without walking and parsing
+the tree. Run this file directly to bring the manifest up to date with the tree.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from pathlib import Path
+
+from monitor_files import write_if_changed
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = Path('monitors') / 'index.json'
+
+
+def content_hash(content):
+    """sha256 of a monitor file's bytes"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def agent_policy_id_of(config):
+    """agentPolicyId of a monitor config (root level first for older files, then its locations)"""
+    if config.get('agentPolicyId'):
+        return config['agentPolicyId']
+    for location in config.get('locations', []):
+        if isinstance(location, dict) and location.get('agentPolicyId'):
+            return location['agentPolicyId']
+    return None
+
+
+class MonitorManifest:
+    """In-memory view of monitors/index.json with config_id and folder lookups
+
+    Entries are keyed by file path (monitors/{space_id}/{location}/{file}.json).
+    'revision' is the Kibana revision the file was last written from by an
+    export or import; it is cleared when refresh() finds the file edited, so
+    a recorded revision always means "this file matches that revision".
+    Files confirmed current during this run are remembered, so repeated
+    lookups do not hash them again.
+    """
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH, files=None):
+        self.path = Path(path)
+        self.monitors_dir = self.path.parent
+        self.files = {}
+        self.by_config_id = {}  # (space_id, config_id) -> set of file paths
+        self.by_folder = {}  # 'space_id/location' -> set of file paths
+        self.verified = set()  # Paths whose hash was checked (or written) during this run
+        self.lock = threading.Lock()
+        for file_path, entry in (files or {}).items():
+            self._set(file_path, entry)
+
+    @classmethod
+    def load(cls, path=DEFAULT_MANIFEST_PATH):
+        """Load the manifest, or start an empty one if it is missing, unreadable or from another version"""
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Ignoring unreadable monitor manifest {path}: {str(e)}")
+            return cls(path)
+        if data.get('version') != MANIFEST_VERSION:
+            print(f"⚠️  Ignoring monitor manifest {path} with version {data.get('version')}")
+            return cls(path)
+        return cls(path, data.get('files', {}))
+
+    def save(self):
+        """Write the manifest (left untouched when nothing changed); returns True if it was written"""
+        with self.lock:
+            content = json.dumps({'version': MANIFEST_VERSION, 'files': self.files},
+                                 indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return write_if_changed(self.path, content)
+
+    def _key(self, file_path):
+        return Path(file_path).as_posix()
+
+    def _set(self, file_path, entry):
+        key = self._key(file_path)
+        self._unset(key)
+        self.files[key] = entry
+        if entry.get('config_id'):
+            self.by_config_id.setdefault((entry['space_id'], entry['config_id']), set()).add(key)
+        self.by_folder.setdefault(f"{entry['space_id']}/{entry['location_folder']}", set()).add(key)
+
+    def _unset(self, key):
+        entry = self.files.pop(key, None)
+        self.verified.discard(key)
+        if entry is None:
+            return
+        paths = self.by_config_id.get((entry['space_id'], entry.get('config_id')))
+        if paths:
+            paths.discard(key)
+        paths = self.by_folder.get(f"{entry['space_id']}/{entry['location_folder']}")
+        if paths:
+            paths.discard(key)
+
+    def _entry(self, file_path, config, content, revision):
+        parts = Path(file_path).parts
+        return {
+            'space_id': parts[-3],
+            'location_folder': parts[-2],
+            'config_id': config.get('config_id'),
+            'name': config.get('name'),
+            'locations': [location.get('id') for location in config.get('locations', [])
+                          if isinstance(location, dict)],
+            'agentPolicyId': agent_policy_id_of(config),
+            'sha256': content_hash(content),
+            'size': len(content),
+            'revision': revision
+        }
+
+    def record(self, file_path, config, revision=None, content=None):
+        """Record a file just written from Kibana's config at revision (content is read back if not given)"""
+        if content is None:
+            content = Path(file_path).read_bytes()
+        entry = self._entry(file_path, config, content, revision)
+        with self.lock:
+            self._set(file_path, entry)
+            self.verified.add(self._key(file_path))
+
+    def remove(self, file_path):
+        """Forget a file that was deleted or renamed"""
+        with self.lock:
+            self._unset(self._key(file_path))
+
+    def entry(self, file_path):
+        """Manifest entry for a file, or None"""
+        return self.files.get(self._key(file_path))
+
+    def is_current(self, file_path):
+        """Check that a file still has the content recorded for it (a size check, then its hash)"""
+        key = self._key(file_path)
+        if key in self.verified:
+            return True
+        entry = self.files.get(key)
+        if entry is None:
+            return False
+        try:
+            content = Path(file_path).read_bytes()
+        except OSError:
+            return False
+        if len(content) != entry['size'] or content_hash(content) != entry['sha256']:
+            return False
+        with self.lock:
+            self.verified.add(key)
+        return True
+
+    def refresh(self, file_paths, prune=False, on_parse=None):
+        """Bring entries for file_paths up to date; only files whose hash changed are parsed
+
+        Edited files lose their recorded revision. on_parse(file_path, config)
+        receives every config parsed along the way so callers need not parse
+        it again. With prune, entries for files not in file_paths (deleted
+        from the tree) are dropped. Returns the number of entries added or
+        changed.
+        """
+        changed = 0
+        keys = set()
+        for file_path in file_paths:
+            key = self._key(file_path)
+            keys.add(key)
+            if key in self.verified:
+                continue
+            try:
+                content = Path(file_path).read_bytes()
+            except OSError:
+                continue
+            entry = self.files.get(key)
+            if entry is not None and len(content) == entry['size'] and content_hash(content) == entry['sha256']:
+                with self.lock:
+                    self.verified.add(key)
+                continue
+            try:
+                config = json.loads(content)
+            except json.JSONDecodeError:
+                self.remove(file_path)  # Reported by whoever loads the file
+                continue
+            if on_parse is not None:
+                on_parse(file_path, config)
+            new_entry = self._entry(file_path, config, content, None)
+            with self.lock:
+                self._set(file_path, new_entry)
+                self.verified.add(key)
+            changed += 1
+
+        if prune:
+            with self.lock:
+                for key in [key for key in self.files if key not in keys]:
+                    self._unset(key)
+                    changed += 1
+        return changed
+
+    def refresh_tree(self):
+        """Refresh every monitors/{space_id}/{location}/*.json file and drop entries for removed files"""
+        file_paths = sorted(self.monitors_dir.glob('*/*/*.json'))
+        return self.refresh(file_paths, prune=True)
+
+    def files_for(self, space_id, config_id):
+        """Paths of the files recorded for a monitor"""
+        return sorted(self.by_config_id.get((space_id, config_id), ()))
+
+    def is_synced(self, space_id, config_id, revision):
+        """Check that every file of a monitor is unchanged since it was written from this Kibana revision"""
+        file_paths = self.files_for(space_id, config_id)
+        if not file_paths or revision is None:
+            return False
+        return all(self.files[path]['revision'] == revision and self.is_current(path) for path in file_paths)
+
+    def agent_policy_id(self, folder_name):
+        """agentPolicyId of a 'space_id/location' folder from its current entries, or None"""
+        for file_path in sorted(self.by_folder.get(folder_name, ())):
+            entry = self.files.get(file_path)
+            if entry and entry.get('agentPolicyId') and self.is_current(file_path):
+                return entry['agentPolicyId']
+        return None
+
+    def __len__(self):
+        return len(self.files)
+
+
+def main():
+    """Refresh monitors/index.json from the monitor tree"""
+    manifest_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MANIFEST_PATH
+    manifest = MonitorManifest.load(manifest_path)
+    changed = manifest.refresh_tree()
+    written = manifest.save()
+    print(f"{len(manifest)} monitor files in {manifest_path} ({changed} entries changed"
+          f"{', written' if written else ', unchanged'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Offline schema checks for monitor configs, one validator per monitor type"""
+
+import re
+
+_NUMBER = re.compile(r'^\d+(\.\d+)?$')
+_HTTP_URL = re.compile(r'^https?://\S+$')
+_HOST_PORT = re.compile(r'^\S+:\d+$')
+_PARAM = re.compile(r'\$\{[^}]+\}')  # Monitor parameter reference, resolved by the agent
+
+# Field specs: field -> (accepted Python types, allowed values or None). Fields not listed are
+# passed through unchecked, since Kibana adds type-specific fields between versions. name, type
+# and locations are checked by monitor_files.check_monitor_config.
+COMMON_FIELDS = {
+    'enabled': ((bool,), None),
+    'schedule': ((dict,), None),
+    'namespace': ((str,), None),
+    'alert': ((dict,), None),
+    'tags': ((list,), None),
+    'max_attempts': ((int,), None),
+    'retest_on_failure': ((bool,), None),
+    'params': ((str, dict), None),
+    'ssl.verification_mode': ((str,), ('full', 'certificate', 'strict', 'none')),
+    'ssl.supported_protocols': ((list,), None),
+}
+
+TYPE_FIELDS = {
+    'browser': {
+        'inline_script': ((str,), None),
+        'url': ((str,), None),
+        'screenshots': ((str,), ('on', 'off', 'only-on-failure')),
+        'ignore_https_errors': ((bool,), None),
+        'throttling': ((dict, str), None),
+        'synthetics_args': ((list,), None),
+    },
+    'http': {
+        'url': ((str,), None),
+        'timeout': ((str, int, float), None),
+        'max_redirects': ((str, int), None),
+        'mode': ((str,), ('any', 'all')),
+        'ipv4': ((bool,), None),
+        'ipv6': ((bool,), None),
+        'check.request.method': ((str,), None),
+        'check.request.body': ((dict,), None),
+        'check.request.headers': ((dict,), None),
+        'response.include_body': ((str,), ('on_error', 'always', 'never')),
+        'response.include_headers': ((bool,), None),
+        'response.include_body_max_bytes': ((str, int), None),
+    },
+    'tcp': {
+        'host': ((str,), None),
+        'timeout': ((str, int, float), None),
+        'proxy_use_local_resolver': ((bool,), None),
+    },
+    'icmp': {
+        'host': ((str,), None),
+        'timeout': ((str, int, float), None),
+        'wait': ((str, int, float), None),
+    },
+}
+
+# Fields a monitor of each type cannot be created without
+REQUIRED_FIELDS = {
+    'browser': ('inline_script',),
+    'http': ('url',),
+    'tcp': ('host',),
+    'icmp': ('host',),
+}
+
+NUMERIC_FIELDS = ('timeout', 'wait', 'max_redirects', 'response.include_body_max_bytes')
+
+_validators = {}  # monitor type -> compiled validator
+
+
+def _type_name(types):
+    return ' or '.join({str: 'string', bool: 'boolean', int: 'integer', float: 'number',
+                        dict: 'object', list: 'list'}[t] for t in types)
+
+
+def _compile_field(field, types, allowed):
+    """Build the check for one field; returns check(value) -> error message or None"""
+    expected = f"'{field}' must be a {_type_name(types)}"
+    numeric = field in NUMERIC_FIELDS
+
+    def check(value):
+        # bool is an int subclass; a true/false where a number is expected is an error
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            return f"{expected}, got {type(value).__name__}"
+        if allowed is not None and value not in allowed:
+            return f"'{field}' must be one of {', '.join(allowed)}, got '{value}'"
+        if numeric and isinstance(value, str) and not _NUMBER.match(value):
+            return f"'{field}' must be numeric, got '{value}'"
+        return None
+    return check
+
+
+def _check_schedule(schedule):
+    errors = []
+    if schedule.get('unit') not in ('m', 's'):
+        errors.append(f"'schedule.unit' must be 'm' or 's', got {schedule.get('unit')!r}")
+    number = schedule.get('number')
+    if isinstance(number, bool) or not (isinstance(number, int) or (isinstance(number, str) and _NUMBER.match(number))):
+        errors.append(f"'schedule.number' must be numeric, got {number!r}")
+    return errors
+
+
+def _check_target(monitor_type, config):
+    """Type-specific checks on url/host beyond their type
+
+    Values that use a parameter such as ${base_url} are only known once the
+    agent resolves them, so their format is not checked.
+    """
+    if monitor_type == 'http' and isinstance(config.get('url'), str) and not _PARAM.search(config['url']):
+        if not _HTTP_URL.match(config['url']):
+            return [f"'url' must be an http(s) URL, got '{config['url']}'"]
+    if monitor_type == 'tcp' and isinstance(config.get('host'), str) and not _PARAM.search(config['host']):
+        if not _HOST_PORT.match(config['host']):
+            return [f"'host' must be host:port, got '{config['host']}'"]
+    return []
+
+
+def _compile(monitor_type):
+    """Compile the validator for a monitor type; returns validate(config) -> [errors]"""
+    fields = dict(COMMON_FIELDS, **TYPE_FIELDS[monitor_type])
+    checks = [(field, _compile_field(field, types, allowed)) for field, (types, allowed) in fields.items()]
+    required = REQUIRED_FIELDS[monitor_type]
+
+    def validate(config):
+        errors = []
+        for field in required:
+            if field == 'inline_script' and config.get('origin') == 'project':
+                continue  # Project browser monitors carry their journey in a bundle
+            if config.get(field) in (None, ''):
+                errors.append(f"{monitor_type} monitors need '{field}'")
+        for field, check in checks:
+            if field in config:
+                error = check(config[field])
+                if error:
+                    errors.append(error)
+        if isinstance(config.get('schedule'), dict):
+            errors.extend(_check_schedule(config['schedule']))
+        errors.extend(_check_target(monitor_type, config))
+        return errors
+    return validate
+
+
+def get_validator(monitor_type):
+    """Cached validator for a monitor type, or None if the type is unknown"""
+    if monitor_type not in TYPE_FIELDS:
+        return None
+    validator = _validators.get(monitor_type)
+    if validator is None:
+        validator = _validators[monitor_type] = _compile(monitor_type)
+    return validator
+
+
+def validate_monitor_schema(config):
+    """Return the schema errors of a monitor config (empty if it is valid)"""
+    monitor_type = config.get('type')
+    validator = get_validator(monitor_type)
+    if validator is None:
+        return [f"unknown monitor type {monitor_type!r} (expected {', '.join(TYPE_FIELDS)})"]
+    return validator(config)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Thread-pool helpers that keep per-task console output grouped together"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_local = threading.local()
+_install_lock = threading.Lock()
+
+
+class _OutputRouter:
+    """sys.stdout proxy that diverts writes from capturing threads into their buffer"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = getattr(_local, 'buffer', None)
+        if buffer is None:
+            return self.stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        if getattr(_local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _install_router():
+    """Route sys.stdout through _OutputRouter (idempotent)"""
+    with _install_lock:
+        if not isinstance(sys.stdout, _OutputRouter):
+            sys.stdout = _OutputRouter(sys.stdout)
+
+
+def _call_with_buffer(buffer, func, *args, **kwargs):
+    """Run func with the current thread's output diverted into buffer"""
+    previous = getattr(_local, 'buffer', None)
+    _local.buffer = buffer
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _local.buffer = previous
+
+
+def bind_output(func):
+    """Wrap func so worker threads write into the calling thread's output buffer (if any)"""
+    buffer = getattr(_local, 'buffer', None)
+    if buffer is None:
+        return func
+
+    def bound(*args, **kwargs):
+        return _call_with_buffer(buffer, func, *args, **kwargs)
+    return bound
+
+
+def run_grouped(func, items, max_workers):
+    """Run func(item) for each item on a bounded pool, keeping each item's output together
+
+    Output printed by func (and by pools it starts via bind_output) is buffered
+    and flushed as one block per item, in input order. Returns a list of
+    (item, result, error) tuples in input order; error is None on success.
+    With a single item or a single worker the items run inline with live output.
+    """
+    items = list(items)
+
+    def run(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [run(item) for item in items]
+
+    _install_router()
+
+    def run_captured(item):
+        buffer = io.StringIO()
+        outcome = _call_with_buffer(buffer, run, item)
+        return outcome, buffer.getvalue()
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_captured, item) for item in items]
+        for future in futures:
+            outcome, output = future.result()
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            results.append(outcome)
+    return results
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Adaptive client-side concurrency limiting for Kibana API calls"""
+
+import threading
+import time
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to Kibana with AIMD (additive-increase, multiplicative-decrease)
+
+    Every uncongested completion grows the limit by 1/limit (about +1 per
+    round trip of the whole window). A 429/503, a timeout, or latency well
+    above the best latency seen so far (by latency_tolerance times and at
+    least latency_slack seconds) halves it, at most once per cooldown
+    so one burst of throttled responses counts as a single congestion event.
+    """
+
+    def __init__(self, name, maximum, initial=None, minimum=1, adaptive=True,
+                 latency_tolerance=2.0, latency_slack=0.25, cooldown=1.0):
+        self.name = name
+        self.maximum = max(1, int(maximum))
+        self.minimum = max(1, min(int(minimum), self.maximum))
+        self.adaptive = adaptive
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack  # Ignore jitter on very fast responses
+        self.cooldown = cooldown
+
+        if not adaptive:
+            initial = self.maximum
+        elif initial is None:
+            initial = min(4, self.maximum)
+        self.limit = float(max(self.minimum, min(int(initial), self.maximum)))
+
+        self.in_flight = 0
+        self.latency_ewma = None  # Smoothed recent latency
+        self.latency_floor = None  # Best smoothed latency seen (uncongested baseline)
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Block until a slot is free under the current limit"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency=None, congested=False, observed=True):
+        """Free a slot and feed the outcome (latency in seconds, congestion signal) into the limit
+
+        With observed=False (the request failed before any outcome was seen)
+        the slot is freed and the limit is left as it is.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            if self.adaptive and observed:
+                if latency is not None:
+                    congested = self._observe_latency(latency) or congested
+                if congested:
+                    self._decrease()
+                else:
+                    self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self.condition.notify_all()
+
+    def _observe_latency(self, latency):
+        """Track latency and report whether it signals congestion"""
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency
+        if self.latency_floor is None or self.latency_ewma < self.latency_floor:
+            self.latency_floor = self.latency_ewma
+        else:
+            # Let the baseline drift up slowly so a permanently slower cluster is not punished forever
+            self.latency_floor *= 1.001
+        threshold = max(self.latency_floor * self.latency_tolerance, self.latency_floor + self.latency_slack)
+        return self.latency_ewma > threshold
+
+    def _decrease(self):
+        """Halve the limit, at most once per cooldown window"""
+        now = time.monotonic()
+        if now - self.last_decrease < self.cooldown:
+            return
+        self.last_decrease = now
+        previous = int(self.limit)
+        self.limit = max(float(self.minimum), self.limit / 2)
+        if int(self.limit) < previous:
+            print(f"⚠️  Kibana {self.name} budget reduced to {int(self.limit)} concurrent requests")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Deterministic sharding of monitors across parallel CI jobs, and per-shard run summaries"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+
+class Shard:
+    """Shard i of N (0-based); a monitor belongs to exactly one shard
+
+    Ownership hashes the monitor's config_id (or its file path when it has
+    no id yet) with sha256, so every runner agrees on the split regardless
+    of Python's per-process hash seed.
+    """
+
+    def __init__(self, index, count):
+        if count < 1 or not 0 <= index < count:
+            raise ValueError(f"invalid shard {index}/{count}: expected 0 <= i < N")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, spec):
+        """Parse 'i/N' (argparse type)"""
+        try:
+            index, count = (int(part) for part in spec.split('/'))
+            return cls(index, count)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(f"--shard expects i/N with 0 <= i < N, got '{spec}' ({e})")
+
+    @staticmethod
+    def shard_of(key, count):
+        """Shard number for a key"""
+        digest = hashlib.sha256(str(key).encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big') % count
+
+    def owns(self, key):
+        """Check whether this shard handles the monitor identified by key"""
+        return self.shard_of(key, self.count) == self.index
+
+    @property
+    def suffix(self):
+        """Filename suffix for per-shard state files"""
+        return f".shard-{self.index}-of-{self.count}"
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+
+def write_summary(path, script, shard, counts, failed=None, spaces=None):
+    """Write a shard's run summary for merge-shard-summaries.py
+
+    counts is a flat {name: number} mapping, spaces maps space_id to such a
+    mapping, and failed lists failure descriptions.
+    """
+    summary = {
+        'script': script,
+        'shard': str(shard) if shard else '0/1',
+        'counts': dict(counts),
+        'spaces': {space_id: dict(space_counts) for space_id, space_counts in (spaces or {}).items()},
+        'failed': list(failed or [])
+    }
+    path = Path(path)
+    if path.parent != Path('.'):
+        path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def merge_summaries(summaries):
+    """Combine per-shard summaries into one; reports shards that are missing or duplicated"""
+    merged = {'scripts': set(), 'counts': {}, 'spaces': {}, 'failed': [], 'shards': [], 'problems': []}
+    shard_counts = set()
+
+    for summary in summaries:
+        merged['scripts'].add(summary.get('script'))
+        merged['shards'].append(summary.get('shard', '0/1'))
+        shard_counts.add(int(summary.get('shard', '0/1').split('/')[1]))
+        for name, value in summary.get('counts', {}).items():
+            merged['counts'][name] = merged['counts'].get(name, 0) + value
+        for space_id, space_counts in summary.get('spaces', {}).items():
+            target = merged['spaces'].setdefault(space_id, {})
+            for name, value in space_counts.items():
+                target[name] = target.get(name, 0) + value
+        merged['failed'].extend(summary.get('failed', []))
+
+    if len(merged['scripts']) > 1:
+        merged['problems'].append(f"summaries from different scripts: {', '.join(sorted(map(str, merged['scripts'])))}")
+    if len(shard_counts) > 1:
+        merged['problems'].append(f"summaries from different shard counts: {sorted(shard_counts)}")
+    elif shard_counts:
+        count = shard_counts.pop()
+        seen = [int(shard.split('/')[0]) for shard in merged['shards']]
+        missing = sorted(set(range(count)) - set(seen))
+        duplicated = sorted({index for index in seen if seen.count(index) > 1})
+        if missing:
+            merged['problems'].append(f"missing shards: {', '.join(f'{index}/{count}' for index in missing)}")
+        if duplicated:
+            merged['problems'].append(f"duplicate shards: {', '.join(f'{index}/{count}' for index in duplicated)}")
+
+    merged['scripts'] = sorted(map(str, merged['scripts']))
+    return merged
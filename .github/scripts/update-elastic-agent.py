@@ -3,26 +3,30 @@
 import os
 import sys
 import json
-import requests
 from pathlib import Path
 
+from kibana_client import KibanaClient, KibanaRequestError
+from monitor_manifest import MonitorManifest, agent_policy_id_of
+
 class ElasticAgentUpdater:
-    def __init__(self, kibana_url, api_key):
+    def __init__(self, kibana_url, api_key, client=None):
         self.kibana_url = kibana_url.rstrip('/')
         
-        # Setup Kibana session
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'ApiKey {api_key}',
-            'Content-Type': 'application/json',
-            'kbn-xsrf': 'true'
-        })
+        # Shared Kibana client: pooled connections, timeouts and retries
+        self.client = client or KibanaClient(kibana_url, api_key)
+        
+        # monitors/index.json: agentPolicyId per folder without parsing monitor files
+        self.manifest = MonitorManifest.load(Path('monitors') / 'index.json')
 
 
 
     def extract_agent_policy_id(self, folder_name):
         """Extract agentPolicyId from first JSON file in folder"""
         # folder_name is now in format "spaceid/location"
+        agent_policy_id = self.manifest.agent_policy_id(folder_name)
+        if agent_policy_id:
+            return agent_policy_id
+        
         folder_path = Path('monitors') / folder_name
         
         if not folder_path.exists():
@@ -36,18 +40,13 @@ class ElasticAgentUpdater:
         try:
             with open(json_files[0], 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                
-                # Check root level first (backward compatibility)
-                if 'agentPolicyId' in data:
-                    return data['agentPolicyId']
-                
-                # Check in locations array
-                locations = data.get('locations', [])
-                for location in locations:
-                    if 'agentPolicyId' in location:
-                        return location['agentPolicyId']
-                
-                return None
+            
+            # Root level first (backward compatibility), then the locations array
+            agent_policy_id = agent_policy_id_of(data)
+            
+            # Not in the manifest (or out of date): record the folder for the next lookup
+            self.manifest.refresh(json_files)
+            return agent_policy_id
         except (json.JSONDecodeError, FileNotFoundError) as e:
             print(f"Error reading JSON file {json_files[0]}: {e}")
             return None
@@ -55,11 +54,9 @@ class ElasticAgentUpdater:
     def fetch_elastic_agent_config(self, agent_policy_id):
         """Fetch elastic-agent.yml from Kibana API"""
         try:
-            url = f"{self.kibana_url}/api/fleet/agent_policies/{agent_policy_id}/download"
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = self.client.request('GET', f"/api/fleet/agent_policies/{agent_policy_id}/download")
             return response.text
-        except requests.exceptions.RequestException as e:
+        except KibanaRequestError as e:
             raise Exception(f"Failed to fetch elastic-agent.yml: {str(e)}")
 
     def process_k8s_secrets(self, config_content):
@@ -102,13 +99,15 @@ class ElasticAgentUpdater:
 
     def update_elastic_agent_file(self, folder_name, config_content):
         """Update elastic-agent.yml file in specified folder"""
+        # Process K8SSEC_ references for Kubernetes compatibility
+        return self.write_elastic_agent_file(folder_name, self.process_k8s_secrets(config_content))
+
+    def write_elastic_agent_file(self, folder_name, processed_content):
+        """Write an already processed elastic-agent.yml to the specified folder"""
         # folder_name is now in format "spaceid/location"
         file_path = Path('monitors') / folder_name / 'elastic-agent.yml'
         
         try:
-            # Process K8SSEC_ references for Kubernetes compatibility
-            processed_content = self.process_k8s_secrets(config_content)
-            
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(processed_content)
             return True
@@ -128,7 +127,9 @@ class ElasticAgentUpdater:
         
         updated_folders = []
         
-        for folder_name in changed_folders:
+        # Group folders by agent policy so each policy is downloaded once
+        folders_by_policy = {}
+        for folder_name in dict.fromkeys(changed_folders):
             try:
                 print(f"\nProcessing folder: {folder_name}")
                 
@@ -138,22 +139,38 @@ class ElasticAgentUpdater:
                     raise Exception(f"Could not find agentPolicyId in JSON files for folder: {folder_name}")
                 
                 print(f"Found agent policy ID: {agent_policy_id}")
+                folders_by_policy.setdefault(agent_policy_id, []).append(folder_name)
+                    
+            except Exception as e:
+                print(f"❌ Error processing folder {folder_name}: {str(e)}")
+                sys.exit(1)
+        
+        print(f"\n{len(folders_by_policy)} agent policies for {sum(map(len, folders_by_policy.values()))} folders")
+        
+        for agent_policy_id, folder_names in folders_by_policy.items():
+            try:
+                print(f"\nProcessing agent policy: {agent_policy_id} ({', '.join(folder_names)})")
                 
                 # Fetch elastic-agent.yml from API
                 config_content = self.fetch_elastic_agent_config(agent_policy_id)
                 print(f"Fetched elastic-agent.yml config ({len(config_content)} characters)")
                 
-                # Update file
-                if not self.update_elastic_agent_file(folder_name, config_content):
-                    raise Exception(f"Failed to write elastic-agent.yml file for folder: {folder_name}")
-                
-                print(f"✅ Successfully updated elastic-agent.yml for {folder_name}")
-                updated_folders.append(folder_name)
+                # Process K8SSEC_ references once and write the result to every folder using the policy
+                processed_content = self.process_k8s_secrets(config_content)
+                for folder_name in folder_names:
+                    if not self.write_elastic_agent_file(folder_name, processed_content):
+                        raise Exception(f"Failed to write elastic-agent.yml file for folder: {folder_name}")
+                    
+                    print(f"✅ Successfully updated elastic-agent.yml for {folder_name}")
+                    updated_folders.append(folder_name)
                     
             except Exception as e:
-                print(f"❌ Error processing folder {folder_name}: {str(e)}")
+                print(f"❌ Error processing agent policy {agent_policy_id}: {str(e)}")
                 sys.exit(1)
         
+        if self.manifest.save():
+            print(f"Updated monitor manifest {self.manifest.path}")
+        
         print(f"\n✅ Successfully updated {len(updated_folders)} folders: {', '.join(updated_folders)}")
 
 def main():
@@ -173,7 +190,7 @@ def main():
         sys.exit(1)
     
     changed_folders = sys.argv[1:]  # All arguments after script name
-    updater = ElasticAgentUpdater(kibana_url, api_key)
+    updater = ElasticAgentUpdater(kibana_url, api_key, client=KibanaClient.from_env(kibana_url, api_key))
     updater.update_elastic_agent_configs(changed_folders)
 
 if __name__ == "__main__":
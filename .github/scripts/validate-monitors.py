@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Validate monitor files before import, in one process with a worker pool
+Checks JSON syntax and the fields the importer depends on, and reports every error at once
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from monitor_files import scan_monitor_files, validate_monitor_file
+
+def find_files(args):
+    """Files to validate: the given paths, CHANGED_FILES with --changed-files, or the whole tree"""
+    if args.files:
+        return [Path(file_path) for file_path in args.files]
+
+    if args.changed_files:
+        changed_files = [line.strip() for line in os.getenv('CHANGED_FILES', '').split('\n') if line.strip()]
+        # Deleted files show up in diffs too; only monitors/space_id/location/file.json files are monitors
+        return [Path(file_path) for file_path in changed_files
+                if file_path.endswith('.json') and len(Path(file_path).parts) >= 4 and Path(file_path).exists()]
+
+    monitors_dir = Path('monitors')
+    if not monitors_dir.exists():
+        return []
+    return [monitor_file.file_path for monitor_file in scan_monitor_files(monitors_dir)]
+
+def validate_files(file_paths, workers):
+    """Validate files with a process pool (in-process for one worker); returns [(file_path, errors)] in order"""
+    if workers <= 1 or len(file_paths) < 2:
+        return [validate_monitor_file(file_path) for file_path in file_paths]
+
+    # Batches keep inter-process overhead low for trees of many small files
+    chunksize = max(1, min(256, len(file_paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate_monitor_file, file_paths, chunksize=chunksize))
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Validate Synthetics monitor files')
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                       help='Monitor files to validate (default: every monitors/space_id/location/*.json)')
+    parser.add_argument('--changed-files', action='store_true',
+                       help='Only validate the files listed in the CHANGED_FILES environment variable')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('VALIDATE_WORKERS', '0')) or os.cpu_count() or 1,
+                       help='Worker processes (default: VALIDATE_WORKERS or the CPU count)')
+    args = parser.parse_args()
+
+    file_paths = find_files(args)
+    if not file_paths:
+        print("No monitor files to validate")
+        return
+
+    print(f"Validating {len(file_paths)} monitor files with {args.workers} workers...")
+    results = validate_files(file_paths, args.workers)
+
+    invalid = [(file_path, errors) for file_path, errors in results if errors]
+    for file_path, errors in invalid:
+        print(f"❌ {file_path}")
+        for error in errors:
+            print(f"   - {error}")
+
+    if invalid:
+        error_count = sum(len(errors) for _, errors in invalid)
+        print(f"\n{error_count} errors in {len(invalid)} of {len(file_paths)} files")
+        sys.exit(1)
+    print(f"✅ All {len(file_paths)} monitor files are valid")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Offline check that an interrupted and resumed export leaves a complete monitor manifest
+Exports from an in-memory Kibana, interrupts the first run, and compares monitors/index.json with the tree
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent / '.github' / 'scripts'
+
+# Add the .github/scripts directory to Python path
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+spec = importlib.util.spec_from_file_location("export_synthetics_monitors",
+                                              SCRIPTS_DIR / 'export-synthetics-monitors.py')
+export_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(export_module)
+SyntheticsExporter = export_module.SyntheticsExporter
+
+class Interrupted(BaseException):
+    """Stands in for the runner killing the export (not caught like an ordinary error)"""
+
+class FakeKibana:
+    """Monitor list and detail endpoints for one space; can interrupt after a number of detail fetches"""
+
+    def __init__(self, count, locations=2):
+        self.monitors = [
+            {
+                'config_id': f'monitor-{i}',
+                'name': f'Export check {i}',
+                'type': 'http',
+                'url': f'https://example.com/{i}',
+                'revision': 1,
+                'updated_at': '2026-01-01T00:00:00Z',
+                'locations': [{'id': f'loc-{j}', 'label': f'Location {j}', 'isServiceManaged': True}
+                              for j in range(locations)]
+            }
+            for i in range(count)
+        ]
+        self.interrupt_after = None
+
+    def request_json(self, method, endpoint, data=None):
+        path, _, query = endpoint.partition('?')
+        if path.endswith('/monitors'):
+            params = dict(pair.split('=') for pair in query.split('&'))
+            page, per_page = int(params['page']), int(params['perPage'])
+            return {'monitors': self.monitors[(page - 1) * per_page:page * per_page], 'total': len(self.monitors)}
+        if self.interrupt_after is not None:
+            if self.interrupt_after == 0:
+                raise Interrupted()
+            self.interrupt_after -= 1
+        config_id = path.rsplit('/', 1)[1]
+        return next(monitor for monitor in self.monitors if monitor['config_id'] == config_id)
+
+def run_export(kibana):
+    """Run one export of the default space"""
+    exporter = SyntheticsExporter('http://kibana.invalid', None, max_workers=1, page_size=10,
+                                  parallel_pages=False, client=kibana)
+    exporter.export_monitors()
+
+def manifest_gaps():
+    """Monitor files on disk that monitors/index.json has no entry for"""
+    on_disk = {file_path.as_posix() for file_path in Path('monitors').glob('*/*/*.json')}
+    with open(Path('monitors') / 'index.json', 'r', encoding='utf-8') as f:
+        recorded = set(json.load(f)['files'])
+    return sorted(on_disk - recorded), len(on_disk)
+
+def check_resumed_export(count=30):
+    """Interrupt an export, resume it, then rebuild the manifest from an incremental run"""
+    kibana = FakeKibana(count)
+    kibana.interrupt_after = count // 3
+    try:
+        run_export(kibana)
+        print("❌ The first export was not interrupted")
+        return False
+    except Interrupted:
+        pass
+
+    kibana.interrupt_after = None
+    run_export(kibana)
+    missing, total = manifest_gaps()
+    if missing:
+        print(f"❌ After the resumed export, {len(missing)} of {total} files are missing from the manifest")
+        return False
+    print(f"✅ Resumed export: the manifest covers all {total} files")
+
+    # Every monitor is unchanged now, so an incremental run carries all of them forward
+    (Path('monitors') / 'index.json').unlink()
+    run_export(kibana)
+    missing, total = manifest_gaps()
+    if missing:
+        print(f"❌ After an incremental export, {len(missing)} of {total} files are missing from the manifest")
+        return False
+    print(f"✅ Incremental export: the manifest covers all {total} files")
+    return True
+
+def main():
+    """Run the check in a scratch monitors tree"""
+    print("🧪 Export resume manifest check")
+    print("=" * 50)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            return check_resumed_export()
+        finally:
+            os.chdir(cwd)
+
+if __name__ == "__main__":
+    success = main()
+    if not success:
+        sys.exit(1)
+    print("\n✨ Manifest is complete!")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Offline checks that resuming an import or re-applying a plan never repeats a completed create
+Runs imports against an in-memory Kibana and counts the POSTs
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent / '.github' / 'scripts'
+
+# Add the .github/scripts directory to Python path
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from import_journal import ImportJournal
+from import_plan import ImportPlan
+
+spec = importlib.util.spec_from_file_location("import_synthetics_monitors",
+                                              SCRIPTS_DIR / 'import-synthetics-monitors.py')
+import_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(import_module)
+SyntheticsImporter = import_module.SyntheticsImporter
+
+class FakeKibana:
+    """Just enough of the Synthetics monitor API for the importer, counting requests by method"""
+
+    def __init__(self):
+        self.monitors = {}
+        self.requests = {'GET': 0, 'POST': 0, 'PUT': 0}
+
+    def request_json(self, method, endpoint, data=None):
+        self.requests[method] += 1
+        path = endpoint.split('?')[0]
+        if method == 'POST':
+            config_id = f"monitor-{len(self.monitors) + 1}"
+            self.monitors[config_id] = dict(data, config_id=config_id, id=config_id, revision=1)
+            return self.monitors[config_id]
+        if method == 'PUT':
+            config_id = path.rsplit('/', 1)[1]
+            monitor = self.monitors[config_id]
+            monitor.update(data, revision=monitor['revision'] + 1)
+            return monitor
+        if path.endswith('/monitors'):
+            return {'monitors': list(self.monitors.values()), 'total': len(self.monitors)}
+        monitor = self.monitors.get(path.rsplit('/', 1)[1])
+        if monitor is None:
+            raise Exception("404 Not Found")
+        return monitor
+
+def write_monitors(count):
+    """Create count new monitor files (no config_id yet) in monitors/default/test_loc"""
+    location_dir = Path('monitors') / 'default' / 'test_loc'
+    location_dir.mkdir(parents=True)
+    for i in range(count):
+        config = {
+            'name': f'Resume check {i}',
+            'type': 'http',
+            'url': f'https://example.com/{i}',
+            'schedule': {'number': '3', 'unit': 'm'},
+            'locations': [{'id': 'test_loc', 'label': 'Test location', 'isServiceManaged': True}]
+        }
+        with open(location_dir / f'resume-check-{i}.json', 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2)
+
+def run_import(kibana, journal_path, resume, fresh_import):
+    """Run one live import with a journal; returns the POSTs it sent"""
+    posts_before = kibana.requests['POST']
+    importer = SyntheticsImporter('http://kibana.invalid', None, client=kibana)
+    importer.journal = ImportJournal(journal_path, resume=resume)
+    importer.import_monitors(fresh_import=fresh_import)
+    importer.journal.close()
+    return kibana.requests['POST'] - posts_before
+
+def check_resume(count=5):
+    """Complete a fresh import, then resume it; the resumed run must not create anything"""
+    kibana = FakeKibana()
+    journal_path = Path('.synthetics-state') / 'import-journal.jsonl'
+    write_monitors(count)
+
+    created = run_import(kibana, journal_path, resume=False, fresh_import=True)
+    resumed = run_import(kibana, journal_path, resume=True, fresh_import=True)
+
+    if created != count:
+        print(f"❌ Fresh import sent {created} POSTs for {count} monitors")
+        return False
+    if resumed:
+        print(f"❌ Resumed fresh import sent {resumed} POSTs, expected none")
+        return False
+    if len(kibana.monitors) != count:
+        print(f"❌ Kibana has {len(kibana.monitors)} monitors, expected {count}")
+        return False
+    print(f"✅ Fresh import created {created} monitors; the resumed run created none")
+    return True
+
+def check_plan_reapply(count=3):
+    """Apply a plan of new monitors, then apply it again; the second apply must be refused"""
+    kibana = FakeKibana()
+    plan_path = Path('import-plan.json')
+    write_monitors(count)
+
+    planner = SyntheticsImporter('http://kibana.invalid', None, client=kibana, record_plan=True)
+    planner.import_monitors(dry_run=True, plan_path=plan_path)
+    plan = ImportPlan.load(plan_path)
+
+    SyntheticsImporter('http://kibana.invalid', None, client=kibana).apply_plan(plan)
+    created = kibana.requests['POST']
+    try:
+        SyntheticsImporter('http://kibana.invalid', None, client=kibana).apply_plan(plan)
+        refused = False
+    except SystemExit as e:
+        refused = e.code == 1
+    repeated = kibana.requests['POST'] - created
+
+    if created != count:
+        print(f"❌ Applying the plan sent {created} POSTs for {count} monitors")
+        return False
+    if repeated or not refused:
+        print(f"❌ Re-applying the plan sent {repeated} POSTs and was {'' if refused else 'not '}refused")
+        return False
+    print(f"✅ Plan created {created} monitors; applying it again was refused")
+    return True
+
+def main():
+    """Run each check in its own scratch monitors tree"""
+    print("🧪 Import resume and plan re-apply checks")
+    print("=" * 50)
+
+    cwd = os.getcwd()
+    results = []
+    for check in (check_resume, check_plan_reapply):
+        with tempfile.TemporaryDirectory() as work_dir:
+            os.chdir(work_dir)
+            try:
+                results.append(check())
+            finally:
+                os.chdir(cwd)
+    return all(results)
+
+if __name__ == "__main__":
+    success = main()
+    if not success:
+        sys.exit(1)
+    print("\n✨ No create was repeated!")
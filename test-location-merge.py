@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for location merging in the importer
+Compares the old list scan with LocationSet for monitors with many private locations
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+# Add the .github/scripts directory to Python path
+sys.path.insert(0, str(Path(__file__).parent / '.github' / 'scripts'))
+
+from monitor_files import LocationSet
+
+def make_locations(count, prefix):
+    """Build count private locations like the ones found in exported monitor files"""
+    return [
+        {
+            'id': f'{prefix}-{i}',
+            'label': f'{prefix} location {i}',
+            'isServiceManaged': False,
+            'agentPolicyId': f'policy-{i}'
+        }
+        for i in range(count)
+    ]
+
+def merge_with_list_scan(existing_locations, new_locations):
+    """Previous merge: linear scan of the merged list for every new location"""
+    merged_locations = existing_locations.copy()
+    for location in new_locations:
+        if not any(loc.get('id') == location.get('id') for loc in merged_locations):
+            merged_locations.append(location)
+    return merged_locations
+
+def merge_with_location_set(existing_locations, new_locations):
+    """Current merge: LocationSet keyed by location id"""
+    merged_locations = LocationSet(existing_locations)
+    for location in new_locations:
+        merged_locations.add(location)
+    return merged_locations.to_list()
+
+def benchmark(count, repeat=5):
+    """Time both merges with half of the new locations already present"""
+    existing_locations = make_locations(count, 'existing')
+    new_locations = existing_locations[::2] + make_locations(count, 'new')
+
+    expected = merge_with_list_scan(existing_locations, new_locations)
+    actual = merge_with_location_set(existing_locations, new_locations)
+    if [loc['id'] for loc in expected] != [loc['id'] for loc in actual]:
+        print(f"❌ {count} locations: merge results differ")
+        return False
+
+    list_time = min(timeit.repeat(lambda: merge_with_list_scan(existing_locations, new_locations),
+                                  number=1, repeat=repeat))
+    set_time = min(timeit.repeat(lambda: merge_with_location_set(existing_locations, new_locations),
+                                 number=1, repeat=repeat))
+
+    print(f"✅ {count:>5} existing + {len(new_locations):>5} new: "
+          f"list scan {list_time * 1000:9.2f} ms, LocationSet {set_time * 1000:7.2f} ms "
+          f"({list_time / set_time:.0f}x)")
+    return True
+
+def main():
+    """Run the benchmark for several fleet sizes"""
+    print("🚀 Location merge micro-benchmark")
+    print("=" * 50)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 500, 1000, 2000]
+    return all([benchmark(size) for size in sizes])
+
+if __name__ == "__main__":
+    success = main()
+    if not success:
+        sys.exit(1)
+    print("\n✨ Merge results match!")